@@ -1,17 +1,47 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
-from threading import Thread
+from threading import Thread, Lock, current_thread, main_thread
 import time
 import random
 import copy # Import copy for deep copying process list
+import bisect
+import collections
+import heapq
+import queue
 import traceback # For detailed error logging
+import argparse
+import asyncio
+import concurrent.futures
+import csv
+import functools
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import signal
+import stat
+import zipfile
+
+# tkinter is only imported when the GUI starts (see load_gui_toolkit), so the simulation engine,
+# --serve and the Compare All workers also run on Python builds without Tk
+tk = ttk = messagebox = filedialog = None
+
+
+def load_gui_toolkit():
+    """Imports tkinter into the module globals used by SchedulerApp."""
+    global tk, ttk, messagebox, filedialog
+    import tkinter as tk
+    from tkinter import ttk, messagebox, filedialog
 
 class Process:
     def __init__(self, pid, arrival, burst, priority=None):
         self.pid = pid
         self.arrival = int(arrival)
-        self.burst = int(burst)
-        self.remaining = int(burst)
+        # A single burst is CPU only; a sequence alternates CPU and I/O bursts: [cpu, io, cpu, ..., cpu]
+        self.bursts = tuple(int(b) for b in burst) if isinstance(burst, (list, tuple)) else (int(burst),)
+        self.burst = sum(self.bursts[0::2]) # Total CPU time
+        self.io_time = sum(self.bursts[1::2]) # Total I/O service time
+        self.phase = 0 # Index of the current burst; even = CPU, odd = I/O
+        self.remaining = self.bursts[0] # Left in the current CPU burst
         self.priority = int(priority) if priority is not None else None
         self.start_time = None
         self.finish_time = None
@@ -19,32 +49,589 @@ class Process:
         self.color = f"#{random.randint(50, 200):02x}{random.randint(50, 200):02x}{random.randint(50, 200):02x}"
         self.wait_time = 0
         self.turnaround_time = 0
+        self.io_wait_time = 0 # Time spent queued for a free I/O device
+        self.io_wait_start = None
         self.status = "Waiting" # Add status attribute
 
+    @property
+    def remaining_cpu(self):
+        """CPU time still needed, including later CPU bursts."""
+        # During I/O (odd phase) the next CPU burst is at phase + 1 and self.remaining is 0
+        return self.remaining + sum(self.bursts[self.phase + 2 - self.phase % 2::2])
+
     # Add __deepcopy__ for proper copying if needed later, though simple copy works here
-    def __deepcopy__(self, memodict={}):
-        # Create a new instance
-        new_copy = Process(self.pid, self.arrival, self.burst, self.priority)
-        # Copy relevant simulation state attributes
-        new_copy.remaining = self.remaining
-        new_copy.start_time = self.start_time
-        new_copy.finish_time = self.finish_time
-        new_copy.color = self.color # Keep the same color for consistency
-        new_copy.wait_time = self.wait_time
-        new_copy.turnaround_time = self.turnaround_time
-        new_copy.status = self.status
+    def __deepcopy__(self, memodict=None):
+        # Create a new instance without re-running __init__ (which would pick a new random color)
+        new_copy = Process.__new__(Process)
+        # Register in the memo so a process referenced from several lists is copied once
+        if memodict is not None:
+            memodict[id(self)] = new_copy
+        # All attributes are immutable values, so copying them keeps the same color and simulation state
+        new_copy.__dict__.update(self.__dict__)
         return new_copy
 
     def reset(self):
         """Resets process state for a new simulation run."""
-        self.remaining = self.burst
+        self.phase = 0
+        self.remaining = self.bursts[0]
         self.start_time = None
         self.finish_time = None
         self.wait_time = 0
         self.turnaround_time = 0
+        self.io_wait_time = 0
+        self.io_wait_start = None
         self.status = "Waiting"
 
 
+def parse_bursts(value):
+    """Turns a burst given as an int, a list or a "cpu,io,cpu" string into a list of positive ints.
+
+    Raises ValueError unless the bursts alternate CPU and I/O, starting and ending with a CPU burst.
+    """
+    if isinstance(value, str):
+        value = value.split(",")
+    elif not isinstance(value, (list, tuple)):
+        value = [value]
+    try:
+        bursts = [int(b) for b in value]
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid burst value: {value!r}")
+    if len(bursts) % 2 == 0 or any(b <= 0 for b in bursts):
+        raise ValueError("Bursts must be positive and alternate CPU and I/O, starting and ending with CPU.")
+    return bursts
+
+
+SCHEDULER_TYPES = ["FCFS", "SJF Non-Preemptive", "SJF Preemptive",
+                   "Priority Non-Preemptive", "Priority Preemptive", "Round Robin"]
+SNAPSHOT_INTERVAL = 1000 # Simulated time units between live-mode snapshots used for backward seeking
+MAX_SNAPSHOTS = 64 # Beyond this, every other snapshot is dropped and the interval doubles
+GANTT_WINDOW = 300 # Time units redrawn on each live update, ending at the current time
+COMPARE_MAX_LANE_WIDTH = 4000 # Pixels; longer comparisons are drawn at less than 15 px per time unit
+COMPARE_MIN_BLOCK_WIDTH = 1.5 # Pixels; narrower neighbouring blocks in a comparison lane are merged
+COMPARE_LABEL_WIDTH = 170 # Pixels left of the comparison lanes for the algorithm names
+COMPARE_LANE_HEIGHT = 30
+
+
+class SchedulerEngine:
+    """Runs one scheduling algorithm over a list of processes, independent of the GUI.
+
+    advance() moves the clock straight to the next scheduling event (arrival, end of a CPU
+    burst, quantum expiry or I/O completion), optionally stopping early at `until`. Live mode
+    steps it one time unit at a time; static runs and seeks let it jump from event to event.
+
+    A process that finishes a CPU burst with more bursts to go is handed to one of
+    `io_devices` identical I/O devices (FIFO when all are busy). Device completions sit in a
+    heap-ordered event calendar, so I/O never needs per-tick stepping either.
+
+    Other threads may hand in new processes with submit()/submit_many() while it runs;
+    they are picked up at the next event boundary.
+    """
+
+    def __init__(self, processes, scheduler_type, quantum=None, snapshot_interval=None, io_devices=1):
+        self.processes = processes
+        self.scheduler_type = scheduler_type
+        self.quantum = quantum
+        self.io_devices = io_devices
+        self.io_busy = 0 # Devices currently serving a request
+        self.io_queue = collections.deque() # Processes waiting for a free device
+        self.io_events = [] # Event calendar: heap of (completion_time, seq, process)
+        self.current_time = 0
+        self.ready_queue = [] # Heap of (ready_key, seq, process)
+        self.current_process = None
+        self.slice_left = 0 # Remaining quantum of the running process (Round Robin only)
+        self.gantt_data = [] # Stores (pid_str, start_time, duration, color)
+        self.completed_processes = []
+        self.seq = 0 # Tie-breaker so equal keys keep insertion order
+        # Arrival index: the initial processes in arrival order (never changes, so a position is enough),
+        # plus a heap of (arrival, seq, process) for processes submitted while running
+        self.arrivals = [(p.arrival, self.next_seq(), p) for p in sorted(processes, key=lambda p: p.arrival)]
+        self.next_arrival = 0 # Position of the first initial process that has not arrived yet
+        self.pending = []
+        self.submissions = queue.SimpleQueue() # Lists of processes handed in by other threads
+        self.submit_lock = Lock() # Makes "check closed, then queue" atomic against close()
+        self.closed = False # Set once the run is over; later submissions are refused
+        # (drain_time, n, process) for every online submission, kept sorted; n orders equal drain times.
+        # A job submitted after a backward seek is inserted before later entries from the old timeline.
+        self.submission_log = []
+        self.replay = collections.deque() # Logged submissions to re-inject after restoring a snapshot
+        self.snapshot_interval = snapshot_interval
+        self.snapshots = [] # (time, state) pairs in increasing time order
+        self.steps = 0 # Calls to advance() that did work, used to space snapshots by work done
+        self.admit_arrivals()
+        if self.snapshot_interval:
+            self.take_snapshot()
+
+    @property
+    def finished(self):
+        return (self.current_process is None and not self.ready_queue and not self.pending
+                and self.next_arrival >= len(self.arrivals) and not self.io_events and not self.io_queue and not self.replay and self.submissions.empty())
+
+    @property
+    def idle(self):
+        """True if the CPU has nothing to run until the next arrival or I/O completion."""
+        return self.current_process is None and not self.ready_queue
+
+    def is_preemptive(self):
+        return self.scheduler_type in ("SJF Preemptive", "Priority Preemptive")
+
+    def ready_key(self, p):
+        """Sort key for picking the next process; FCFS and Round Robin are plain FIFO."""
+        if self.scheduler_type == "SJF Non-Preemptive":
+            return (p.bursts[p.phase],) # Non-preemptive uses the full length of the next CPU burst
+        if self.scheduler_type == "SJF Preemptive":
+            return (p.remaining,)
+        if "Priority" in self.scheduler_type:
+            return (p.priority, p.arrival)
+        return ()
+
+    def next_seq(self):
+        self.seq += 1
+        return self.seq
+
+    def push_pending(self, p):
+        heapq.heappush(self.pending, (p.arrival, self.next_seq(), p))
+
+    def push_ready(self, p):
+        p.status = "Ready"
+        heapq.heappush(self.ready_queue, (self.ready_key(p), self.next_seq(), p))
+
+    # --- Online submission (thread-safe) ---
+    def submit(self, process):
+        """Queues a new process from any thread; it joins the run at the next event boundary.
+
+        Returns False if the run is already over (see close), in which case nothing is queued.
+        """
+        return self.submit_many([process])
+
+    def submit_many(self, processes):
+        """Queues a batch of new processes as a single hand-over. Returns False if the run is closed."""
+        with self.submit_lock:
+            if self.closed:
+                return False
+            self.submissions.put(list(processes))
+            return True
+
+    def close(self):
+        """Refuses further submissions once the run is finished (scheduler thread only).
+
+        Returns False, leaving the engine open, if a submission slipped in after the last check of
+        `finished`; the caller should then keep running so that job is simulated too.
+        """
+        with self.submit_lock:
+            if not self.submissions.empty():
+                return False
+            self.closed = True
+            return True
+
+    def drain_submissions(self):
+        """Moves submitted processes into the arrival index (scheduler thread only)."""
+        while self.replay and self.replay[0][0] <= self.current_time:
+            p = self.replay.popleft()[2]
+            p.reset()
+            self.processes.append(p)
+            self.push_pending(p)
+        while not self.submissions.empty():
+            for p in self.submissions.get():
+                # The past has already been simulated, so a late job arrives now
+                p.arrival = max(p.arrival, self.current_time)
+                p.status = "Waiting"
+                bisect.insort(self.submission_log, (self.current_time, len(self.submission_log), p))
+                self.processes.append(p)
+                self.push_pending(p)
+
+    def admit_arrivals(self):
+        """Moves every process that has arrived by current_time into the ready queue."""
+        while True:
+            # Take whichever of the two arrival sources is next, in (arrival, seq) order
+            initial = self.arrivals[self.next_arrival] if self.next_arrival < len(self.arrivals) else None
+            if self.pending and (initial is None or self.pending[0] < initial):
+                if self.pending[0][0] > self.current_time:
+                    return
+                self.push_ready(heapq.heappop(self.pending)[2])
+            elif initial is not None and initial[0] <= self.current_time:
+                self.next_arrival += 1
+                self.push_ready(initial[2])
+            else:
+                return
+
+    def start_io(self, p, time):
+        """Hands a process that just finished a CPU burst to a free I/O device, or queues it."""
+        if self.io_busy < self.io_devices:
+            self.io_busy += 1
+            p.status = "I/O"
+            heapq.heappush(self.io_events, (time + p.bursts[p.phase], self.next_seq(), p))
+        else:
+            p.status = "I/O Wait"
+            p.io_wait_start = time
+            self.io_queue.append(p)
+
+    def complete_io(self):
+        """Processes every I/O completion due by current_time, in time order."""
+        while self.io_events and self.io_events[0][0] <= self.current_time:
+            done_time, _, p = heapq.heappop(self.io_events)
+            self.io_busy -= 1
+            if self.io_queue: # The freed device takes the next waiting request
+                waiting = self.io_queue.popleft()
+                waiting.io_wait_time += done_time - waiting.io_wait_start
+                self.start_io(waiting, done_time)
+            p.phase += 1 # Back to the CPU for the next burst
+            p.remaining = p.bursts[p.phase]
+            self.push_ready(p)
+
+    def next_event_time(self):
+        """Time of the next arrival or I/O completion, or None if neither is pending."""
+        times = [heap[0][0] for heap in (self.pending, self.io_events) if heap]
+        if self.next_arrival < len(self.arrivals):
+            times.append(self.arrivals[self.next_arrival][0])
+        return min(times) if times else None
+
+    def dispatch(self):
+        """Preempts and/or selects the process that should hold the CPU at current_time."""
+        if self.current_process and self.ready_queue and self.is_preemptive():
+            # Only a strictly better process preempts, so results do not depend on step size
+            if self.ready_queue[0][0] < self.ready_key(self.current_process):
+                self.push_ready(self.current_process)
+                self.current_process = None
+
+        if self.current_process or not self.ready_queue:
+            return
+
+        self.current_process = heapq.heappop(self.ready_queue)[2]
+        self.current_process.status = "Running"
+        if self.current_process.start_time is None:
+            self.current_process.start_time = self.current_time
+        self.slice_left = self.quantum if self.scheduler_type == "Round Robin" else 0
+
+        pid_str = f"P{self.current_process.pid}"
+        # RR draws every quantum as its own block; other algorithms merge consecutive runs
+        if self.scheduler_type == "Round Robin" or not self.gantt_data or self.gantt_data[-1][0] != pid_str:
+            self.gantt_data.append((pid_str, self.current_time, 0, self.current_process.color))
+
+    def advance(self, until=None):
+        """Runs to the next scheduling event, or to `until` if that comes first."""
+        self.drain_submissions()
+        self.admit_arrivals()
+        if self.replay:
+            # Stop where a replayed submission was originally drained so it re-enters at the same point
+            until = self.replay[0][0] if until is None else min(until, self.replay[0][0])
+        if self.finished or (until is not None and until <= self.current_time):
+            return
+        self.dispatch()
+
+        # Stop at every arrival and I/O completion so the ready queue fills in time order
+        upcoming = self.next_event_time()
+        current = self.current_process
+        if current:
+            end_time = self.current_time + current.remaining
+            if self.scheduler_type == "Round Robin":
+                end_time = min(end_time, self.current_time + self.slice_left)
+            if upcoming is not None:
+                end_time = min(end_time, upcoming)
+        else:
+            end_time = upcoming if upcoming is not None else until # CPU idle until the next event
+        if until is not None:
+            end_time = min(end_time, until)
+        duration = end_time - self.current_time
+
+        # --- Gantt Chart Update ---
+        if current:
+            last_entry = self.gantt_data[-1]
+            self.gantt_data[-1] = (last_entry[0], last_entry[1], last_entry[2] + duration, last_entry[3])
+            current.remaining -= duration
+            self.slice_left -= duration
+        elif self.gantt_data and self.gantt_data[-1][0] == "Idle":
+            last_entry = self.gantt_data[-1]
+            self.gantt_data[-1] = (last_entry[0], last_entry[1], last_entry[2] + duration, last_entry[3])
+        else:
+            self.gantt_data.append(("Idle", self.current_time, duration, "#E0E0E0")) # Grey for idle
+        self.current_time = end_time
+
+        # Arrivals and I/O returns at the end of a quantum queue up ahead of the process being rotated out
+        self.admit_arrivals()
+        self.complete_io()
+
+        if current and current.remaining == 0 and current.phase + 1 < len(current.bursts):
+            current.phase += 1 # CPU burst done, off to I/O
+            self.start_io(current, self.current_time)
+            self.current_process = None # CPU becomes free
+        elif current and current.remaining == 0:
+            current.finish_time = self.current_time # Finish time is *now*
+            current.turnaround_time = current.finish_time - current.arrival
+            # Waiting time is time spent in the ready queue
+            current.wait_time = current.turnaround_time - current.burst - current.io_time - current.io_wait_time
+            current.status = "Completed"
+            self.completed_processes.append(current)
+            self.current_process = None # CPU becomes free
+        elif current and self.scheduler_type == "Round Robin" and self.slice_left == 0:
+            self.push_ready(current) # Quantum expired, back of the queue
+            self.current_process = None
+
+        self.steps += 1
+        # A snapshot costs about one step per in-flight process, so wait for at least that many steps
+        # as well as the time interval; seeking then replays no more work than the snapshot saved
+        if self.snapshot_interval:
+            last_time, last = self.snapshots[-1]
+            if (self.current_time >= last_time + self.snapshot_interval
+                    and self.steps - last["steps"] >= len(last["fields"])):
+                self.take_snapshot()
+
+    def run(self):
+        """Runs the whole simulation at full speed."""
+        while not self.finished:
+            self.advance()
+
+    def run_until(self, target):
+        """Advances at full speed to time `target` (or until every process completes)."""
+        while not self.finished and self.current_time < target:
+            self.advance(until=target)
+
+    # --- Snapshots for seeking ---
+    def take_snapshot(self):
+        """Records what is needed to return to current_time later.
+
+        Only state that can still change is copied: the queues and the mutable fields of processes
+        that have arrived but not finished. Processes that have not arrived are untouched and finished
+        ones never change again, so the arrival index and the append-only lists are kept as lengths.
+        """
+        in_flight = ([entry[2] for entry in self.ready_queue] + list(self.io_queue)
+                     + [entry[2] for entry in self.io_events])
+        if self.current_process:
+            in_flight.append(self.current_process)
+        state = {
+            "current_time": self.current_time, "steps": self.steps, "seq": self.seq, "slice_left": self.slice_left,
+            "io_busy": self.io_busy, "next_arrival": self.next_arrival, "current_process": self.current_process,
+            "ready_queue": list(self.ready_queue), "pending": list(self.pending),
+            "io_queue": list(self.io_queue), "io_events": list(self.io_events),
+            "fields": [(p, p.phase, p.remaining, p.start_time, p.status, p.io_wait_time, p.io_wait_start)
+                       for p in in_flight],
+            "process_count": len(self.processes), "completed_count": len(self.completed_processes),
+            # The Gantt list is append-only apart from its last block, so a length and that block suffice
+            "gantt_len": len(self.gantt_data), "gantt_last": self.gantt_data[-1] if self.gantt_data else None,
+        }
+        self.snapshots.append((self.current_time, state))
+        if len(self.snapshots) > MAX_SNAPSHOTS:
+            del self.snapshots[1::2]
+            self.snapshot_interval *= 2
+
+    def restore(self, state):
+        # Lists are updated in place so outside references (the GUI's process list) stay valid,
+        # and copied so the snapshot stays reusable
+        # Processes that arrived after the snapshot go back to their untouched state
+        for _, _, p in self.arrivals[state["next_arrival"]:self.next_arrival]:
+            p.reset()
+        for _, _, p in state["pending"]:
+            p.reset()
+        for p, phase, remaining, start_time, status, io_wait_time, io_wait_start in state["fields"]:
+            p.phase = phase
+            p.remaining = remaining
+            p.start_time = start_time
+            p.status = status
+            p.io_wait_time = io_wait_time
+            p.io_wait_start = io_wait_start
+            p.finish_time = None
+            p.wait_time = 0
+            p.turnaround_time = 0
+        del self.processes[state["process_count"]:] # Later submissions are replayed below
+        del self.completed_processes[state["completed_count"]:]
+        self.ready_queue[:] = state["ready_queue"]
+        self.pending[:] = state["pending"]
+        self.io_queue = collections.deque(state["io_queue"])
+        self.io_events = list(state["io_events"])
+        self.current_process = state["current_process"]
+        self.next_arrival = state["next_arrival"]
+        self.io_busy = state["io_busy"]
+        self.current_time = state["current_time"]
+        self.steps = state["steps"]
+        self.seq = state["seq"]
+        self.slice_left = state["slice_left"]
+        del self.gantt_data[state["gantt_len"]:]
+        if state["gantt_last"] is not None:
+            self.gantt_data[-1] = state["gantt_last"]
+        # Jobs submitted after the snapshot was taken are re-injected when the clock reaches their drain time
+        # (Submissions drained at the snapshot time itself came after it was taken)
+        first = bisect.bisect_left(self.submission_log, (state["current_time"],))
+        self.replay = collections.deque(self.submission_log[first:])
+
+    def seek(self, target):
+        """Moves the simulation to time `target`, restoring the nearest earlier snapshot when going back."""
+        if target < self.current_time and self.snapshots:
+            index = bisect.bisect_right([t for t, _ in self.snapshots], target) - 1
+            self.restore(self.snapshots[max(index, 0)][1])
+            del self.snapshots[max(index, 0) + 1:] # Later snapshots get re-taken on the way forward
+        self.run_until(target)
+
+
+def build_processes(specs, scheduler_type):
+    """Creates Process objects from dicts with pid, arrival, burst and (for Priority) priority keys.
+
+    Instead of "burst", an entry may give "bursts": [cpu, io, cpu, ...] for an I/O-bound process.
+
+    Applies the same validation as the GUI form and raises ValueError on bad input.
+    """
+    processes = []
+    seen_pids = set()
+    for spec in specs:
+        try:
+            pid = int(spec["pid"])
+            arrival = int(spec["arrival"])
+            bursts = spec["bursts"] if "bursts" in spec else spec["burst"]
+            priority = spec.get("priority")
+            priority = int(priority) if priority is not None else None
+        except (KeyError, TypeError, ValueError, AttributeError):
+            raise ValueError(f"Invalid process entry: {spec!r}")
+        if arrival < 0:
+            raise ValueError(f"Process {pid}: arrival time must be >= 0.")
+        try:
+            bursts = parse_bursts(bursts)
+        except ValueError as e:
+            raise ValueError(f"Process {pid}: {e}")
+        if pid in seen_pids:
+            raise ValueError(f"Process with PID {pid} already exists.")
+        if "Priority" in scheduler_type and (priority is None or priority < 0):
+            raise ValueError(f"Process {pid}: a non-negative priority is required for Priority Scheduling.")
+        seen_pids.add(pid)
+        process = Process(pid, arrival, bursts, priority)
+        if spec.get("color"):
+            process.color = spec["color"] # Keep GUI colors when a run is farmed out to a worker
+        processes.append(process)
+    return processes
+
+
+def build_engine(specs, scheduler_type, quantum=None, io_devices=1):
+    """Validates a headless run and returns its engine, ready to run. Raises ValueError on bad input."""
+    if scheduler_type not in SCHEDULER_TYPES:
+        raise ValueError(f"Unknown scheduler: {scheduler_type!r}")
+    if scheduler_type == "Round Robin":
+        try:
+            quantum = int(quantum)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid Quantum value for Round Robin.")
+        if quantum <= 0:
+            raise ValueError("Quantum must be a positive integer for Round Robin.")
+    try:
+        io_devices = int(io_devices)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid number of I/O devices.")
+    if io_devices <= 0:
+        raise ValueError("There must be at least one I/O device.")
+    return SchedulerEngine(build_processes(specs, scheduler_type), scheduler_type, quantum, io_devices=io_devices)
+
+
+def simulate(specs, scheduler_type, quantum=None, io_devices=1):
+    """Runs a complete simulation without the GUI and returns the finished engine."""
+    engine = build_engine(specs, scheduler_type, quantum, io_devices)
+    engine.run()
+    return engine
+
+
+def percentile(values, q):
+    """Nearest-rank percentile (q in 0-100) of a list of numbers; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)), 1) - 1]
+
+
+def compute_metrics(engine):
+    """Summarizes a finished run: averages, percentiles, throughput, utilization, I/O wait and context switches."""
+    completed = engine.completed_processes
+    n = len(completed)
+    waits = [p.wait_time for p in completed]
+    turnarounds = [p.turnaround_time for p in completed]
+    responses = [p.start_time - p.arrival for p in completed]
+    io_time = sum(p.io_time for p in completed)
+    busy_time = sum(duration for pid_str, _, duration, _ in engine.gantt_data if pid_str != "Idle")
+    # A context switch is the CPU picking up a different process than the one it last ran
+    context_switches = 0
+    last_pid = None
+    for pid_str, _, _, _ in engine.gantt_data:
+        if pid_str == "Idle":
+            continue
+        if last_pid is not None and pid_str != last_pid:
+            context_switches += 1
+        last_pid = pid_str
+    return {
+        "completed": n,
+        "makespan": engine.current_time,
+        "avg_wait": sum(waits) / n if n else 0.0,
+        "p50_wait": percentile(waits, 50),
+        "p95_wait": percentile(waits, 95),
+        "avg_turnaround": sum(turnarounds) / n if n else 0.0,
+        "p50_turnaround": percentile(turnarounds, 50),
+        "p95_turnaround": percentile(turnarounds, 95),
+        "throughput": n / engine.current_time if engine.current_time else 0.0,
+        "avg_response": sum(responses) / n if n else 0.0,
+        "cpu_utilization": busy_time / engine.current_time if engine.current_time else 0.0,
+        "avg_io_wait": sum(p.io_wait_time for p in completed) / n if n else 0.0,
+        "io_utilization": io_time / (engine.io_devices * engine.current_time) if engine.current_time else 0.0,
+        "context_switches": context_switches,
+    }
+
+
+def run_comparison_job(specs, scheduler_type, quantum, io_devices=1):
+    """Worker-process entry point for "Compare All": one algorithm's Gantt data and metrics."""
+    try:
+        engine = simulate(specs, scheduler_type, quantum, io_devices)
+    except ValueError as e:
+        return {"scheduler": scheduler_type, "error": str(e)}
+    return {"scheduler": scheduler_type, "gantt": engine.gantt_data, "metrics": compute_metrics(engine)}
+
+
+# Columns of the bulk exports and how to read each one. Times a process never reached (e.g. in an
+# unfinished run) are exported as -1, and the Gantt "pid" is -1 for idle blocks.
+PROCESS_EXPORT_COLUMNS = {
+    "pid": lambda p: p.pid,
+    "arrival": lambda p: p.arrival,
+    "burst": lambda p: p.burst,
+    "io": lambda p: p.io_time,
+    "start": lambda p: p.start_time if p.start_time is not None else -1,
+    "finish": lambda p: p.finish_time if p.finish_time is not None else -1,
+    "wait": lambda p: p.wait_time if p.finish_time is not None else -1,
+    "turnaround": lambda p: p.turnaround_time if p.finish_time is not None else -1,
+    "response": lambda p: p.start_time - p.arrival if p.start_time is not None else -1,
+    "io_wait": lambda p: p.io_wait_time if p.finish_time is not None else -1,
+}
+GANTT_EXPORT_COLUMNS = {
+    "pid": lambda block: -1 if block[0] == "Idle" else int(block[0][1:]),
+    "start": lambda block: block[1],
+    "duration": lambda block: block[2],
+}
+
+
+def export_csv(processes, gantt_data, processes_path, gantt_path):
+    """Writes per-process results and Gantt segments to two CSV files, one row at a time."""
+    for path, columns, items in ((processes_path, PROCESS_EXPORT_COLUMNS, processes),
+                                 (gantt_path, GANTT_EXPORT_COLUMNS, gantt_data)):
+        getters = list(columns.values())
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows([get(item) for get in getters] for item in items)
+
+
+def export_npz(processes, gantt_data, path):
+    """Writes results as a NumPy .npz archive with one int64 array per column.
+
+    Arrays are named process_<column> and gantt_<column>, so np.load(path)["process_wait"] loads
+    a whole column at once. Each column is filled straight from the simulation objects and
+    streamed into the archive, so no per-row Python lists are built.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("NumPy is required for .npz export (pip install numpy).")
+
+    tables = (("process", PROCESS_EXPORT_COLUMNS, processes), ("gantt", GANTT_EXPORT_COLUMNS, gantt_data))
+    # Same layout np.savez produces: an uncompressed zip of .npy files
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for prefix, columns, items in tables:
+            for column, get in columns.items():
+                values = np.fromiter(map(get, items), dtype=np.int64, count=len(items))
+                with archive.open(f"{prefix}_{column}.npy", "w", force_zip64=True) as member:
+                    np.lib.format.write_array(member, values, allow_pickle=False)
+                del values # Only one column is held in memory at a time
+
+
 class SchedulerApp:
     def __init__(self, root):
         self.root = root
@@ -56,8 +643,16 @@ class SchedulerApp:
         self.running = False
         self.paused = False
         self.scheduler_thread = None
+        self.engine = None # SchedulerEngine of the current run
+        self.live = False
+        self.seek_target = None # Time requested via the Seek control, picked up by the scheduler thread
         self.current_time = 0
         self.gantt_data = []
+        self.compare_pool = None # Worker processes for "Compare All", started on first use
+        self.compare_window = None
+        self.compare_run = 0 # Incremented per comparison so late results from an older one are dropped
+        self.compare_results = {} # scheduler_type -> worker result of the current comparison
+        self.compare_scale = 1 # Pixels per time unit, fixed per comparison so each lane is drawn once
         self.setup_ui()
 
     def setup_ui(self):
@@ -80,8 +675,7 @@ class SchedulerApp:
         scheduler_frame.pack(pady=5, padx=10, fill=tk.X)
 
         self.scheduler_type = tk.StringVar(value="FCFS")
-        options = ["FCFS", "SJF Non-Preemptive", "SJF Preemptive",
-                   "Priority Non-Preemptive", "Priority Preemptive", "Round Robin"]
+        options = SCHEDULER_TYPES
 
         tk.Label(scheduler_frame, text="Select Scheduler:", font=("Helvetica", 12),
                  bg="#b2ebf2").pack(side=tk.LEFT, padx=5, pady=5)
@@ -124,6 +718,14 @@ class SchedulerApp:
         self.quantum_entry.insert(0, "2")
         self.quantum_entry.pack(side=tk.LEFT, padx=5)
 
+        # I/O devices row, always shown (only matters for processes with CPU,I/O,CPU bursts)
+        self.io_row = tk.Frame(self.dynamic_input_frame, bg="#b2ebf2")
+        tk.Label(self.io_row, text="I/O Devices:", font=("Helvetica", 11), bg="#b2ebf2").pack(side=tk.LEFT, padx=5)
+        self.io_devices_entry = ttk.Entry(self.io_row, font=("Helvetica", 11), width=10) # Use ttk.Entry
+        self.io_devices_entry.insert(0, "1")
+        self.io_devices_entry.pack(side=tk.LEFT, padx=5)
+        self.io_row.pack(side=tk.LEFT, fill=tk.X, expand=True, pady=2, padx=10)
+
 
         # Button Frame
         button_frame = tk.Frame(controls_frame, bg="#b2ebf2")
@@ -154,12 +756,20 @@ class SchedulerApp:
             ("Clear All", "Red.TButton", self.delete_all_processes),
             ("Start Live", "Teal.TButton", self.start_live),
             ("Pause/Resume", "Orange.TButton", self.toggle_pause),
-            ("Run Static", "Blue.TButton", self.run_static)
+            ("Run Static", "Blue.TButton", self.run_static),
+            ("Compare All", "Blue.TButton", self.compare_all),
+            ("Export", "Green.TButton", self.export_results)
         ]
 
         for text, style_name, command in buttons_config:
             create_button(button_frame, text, style_name, command)
 
+        # Seek control (live mode)
+        tk.Label(button_frame, text="Seek to:", font=("Helvetica", 11), bg="#b2ebf2").pack(side=tk.LEFT, padx=(15, 5))
+        self.seek_entry = ttk.Entry(button_frame, font=("Helvetica", 11), width=8)
+        self.seek_entry.pack(side=tk.LEFT, padx=5)
+        create_button(button_frame, "Seek", "Teal.TButton", self.seek_to, width=6)
+
 
         # --- Middle Frame for Gantt Chart ---
         gantt_outer_frame = tk.Frame(main_pane, bg="#e0f7fa") # Use main background color
@@ -243,11 +853,16 @@ class SchedulerApp:
 
             pid = int(pid_str)
             arrival = int(arrival_str)
-            burst = int(burst_str)
+            try:
+                # "5" is a single CPU burst; "3,4,2" alternates CPU, I/O, CPU
+                bursts = parse_bursts(burst_str)
+            except ValueError as e:
+                 messagebox.showerror("Input Error", f"{e}\nEnter e.g. 5, or 3,4,2 for CPU, I/O, CPU bursts.")
+                 return
 
             # Validate inputs
-            if arrival < 0 or burst <= 0:
-                 messagebox.showerror("Input Error", "Arrival time must be >= 0 and Burst time must be > 0.")
+            if arrival < 0:
+                 messagebox.showerror("Input Error", "Arrival time must be >= 0.")
                  return
             if any(p.pid == pid for p in self.input_processes):
                  messagebox.showerror("Input Error", f"Process with PID {pid} already exists.")
@@ -264,9 +879,12 @@ class SchedulerApp:
                      messagebox.showerror("Input Error", "Priority must be a non-negative integer.")
                      return
 
-            process = Process(pid, arrival, burst, priority)
+            process = Process(pid, arrival, bursts, priority)
             self.input_processes.append(process)
-            self.display_processes_in_table() # Update the main table
+            # Join the live run: the scheduler thread picks it up at its next step.
+            # If the run has just ended, the job is only added to the input list.
+            if not (self.running and self.engine and self.engine.submit(copy.deepcopy(process))):
+                self.display_processes_in_table() # Update the main table
 
             # Clear entries except PID
             self.entries["Arrival Time"].delete(0, tk.END)
@@ -315,6 +933,8 @@ class SchedulerApp:
                      pass # Ignore if thread already finished
         self.running = False
         self.paused = False
+        self.seek_target = None
+        self.engine = None
         self.gantt_chart.delete("all")
         self.stats.config(text="Avg Waiting Time: - | Avg Turnaround Time: -")
         self.completed_processes.clear()
@@ -350,10 +970,12 @@ class SchedulerApp:
             # Show calculated wait/turnaround only when finished
             wait_val = f"{p.wait_time:.2f}" if p.finish_time is not None else "-"
             turnaround_val = f"{p.turnaround_time:.2f}" if p.finish_time is not None else "-"
-            # Show remaining time during run, or burst time initially/after completion
-            remaining_val = p.remaining if p.status in ["Running", "Ready"] else (0 if p.status == "Completed" else p.burst)
+            # Show remaining CPU time during run, or burst time initially/after completion
+            remaining_val = p.remaining_cpu if p.status in ["Running", "Ready", "I/O", "I/O Wait"] else (0 if p.status == "Completed" else p.burst)
+            # CPU-only processes show their burst; I/O-bound ones show the CPU,I/O,... sequence
+            burst_val = p.burst if len(p.bursts) == 1 else ",".join(str(b) for b in p.bursts)
 
-            values = (p.pid, p.arrival, p.burst, priority_val, remaining_val, p.status,
+            values = (p.pid, p.arrival, burst_val, priority_val, remaining_val, p.status,
                       start_val, finish_val, wait_val, turnaround_val)
             self.process_table.insert("", tk.END, values=values)
 
@@ -367,6 +989,34 @@ class SchedulerApp:
              messagebox.showinfo("Info", "Simulation is not running.")
 
 
+    def seek_to(self):
+        """Asks the running live simulation to jump to the time in the seek entry."""
+        if not (self.running and self.live):
+            messagebox.showinfo("Info", "Seek is only available while a live simulation is running.")
+            return
+        try:
+            target = int(self.seek_entry.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter a valid time to seek to.")
+            return
+        if target < 0:
+            messagebox.showerror("Input Error", "Seek time must be >= 0.")
+            return
+        self.seek_target = target # Picked up by the scheduler thread at the next step
+
+
+    def read_io_devices(self):
+        """Returns the number of I/O devices from its entry, or None after reporting an invalid value."""
+        try:
+            io_devices = int(self.io_devices_entry.get())
+        except ValueError:
+            io_devices = 0
+        if io_devices <= 0:
+            messagebox.showerror("Input Error", "I/O Devices must be a positive integer.")
+            return None
+        return io_devices
+
+
     def start_simulation(self, live):
         """Prepares and starts the simulation thread."""
         if self.running:
@@ -377,9 +1027,10 @@ class SchedulerApp:
             return
 
         # Validate Quantum for RR just before starting
+        quantum = None
         if self.scheduler_type.get() == "Round Robin":
              try:
-                 q = int(self.quantum_entry.get())
+                 q = quantum = int(self.quantum_entry.get())
                  if q <= 0:
                      messagebox.showerror("Input Error", "Quantum must be a positive integer for Round Robin.")
                      return
@@ -387,15 +1038,23 @@ class SchedulerApp:
                  messagebox.showerror("Input Error", "Invalid Quantum value for Round Robin.")
                  return
 
+        io_devices = self.read_io_devices()
+        if io_devices is None:
+            return
+
         self.clear_results(clear_input=False) # Clear previous run results, keep input list
 
         # Create deep copies of processes for the simulation run
         self.active_processes = copy.deepcopy(self.input_processes)
         for p in self.active_processes: # Ensure reset state for the run
              p.reset()
+        # Built here rather than in the thread so add_process can submit to it straight away
+        self.engine = SchedulerEngine(self.active_processes, self.scheduler_type.get(), quantum,
+                                      snapshot_interval=SNAPSHOT_INTERVAL if live else None, io_devices=io_devices)
 
         self.running = True
         self.paused = False
+        self.live = live
         self.scheduler_thread = Thread(target=self.run_scheduler, args=(live,), daemon=True)
         self.scheduler_thread.start()
 
@@ -412,32 +1071,24 @@ class SchedulerApp:
     # ==========================================================================
     def run_scheduler(self, live=True):
         try:
-            scheduler_type = self.scheduler_type.get()
-            quantum = None
-            if scheduler_type == "Round Robin":
-                try:
-                    # Quantum already validated in start_simulation, but get value here
-                    quantum = int(self.quantum_entry.get())
-                except ValueError: # Should not happen if validated before
-                    self.root.after(0, lambda: messagebox.showerror("Input Error", "Invalid Quantum value."))
-                    self.running = False
-                    return
-
-            # Use the copied list for the simulation
-            processes_to_schedule = self.active_processes
-            self.completed_processes = []
-            ready_queue = []
+            # The engine works on the copied list and updates these lists in place
+            engine = self.engine
+            self.completed_processes = engine.completed_processes
+            self.gantt_data = engine.gantt_data # Stores (pid_str, start_time, duration, color)
             self.current_time = 0
-            self.gantt_data = [] # Stores (pid_str, start_time, duration, color)
 
-            current_process = None
+            if not live:
+                engine.run() # Static mode: jump from event to event
+                while not engine.close(): # A job was added just as the run ended
+                    engine.run()
+                self.current_time = engine.current_time
+                self.root.after(0, self.finalize_simulation)
+                return
 
-            n_processes = len(processes_to_schedule)
-
-            # Main simulation loop: Continue while not all processes are completed OR there are still ready/waiting processes
-            while len(self.completed_processes) < n_processes:
+            # close() fails if a job was submitted after the last step, so the loop picks it up
+            while not (engine.finished and engine.close()):
                 # Check for pause/stop signals
-                while self.paused and self.running:
+                while self.paused and self.running and self.seek_target is None:
                     time.sleep(0.1)
                 if not self.running: # Check if stop was requested externally
                      print("Simulation stopped externally.")
@@ -445,205 +1096,27 @@ class SchedulerApp:
                      self.root.after(0, self.update_ui, self.gantt_data, self.active_processes)
                      return # Exit the thread
 
-                # 1. Add newly arrived processes to the ready queue
-                newly_arrived = [p for p in processes_to_schedule
-                                 if p.arrival <= self.current_time and p.status == "Waiting"]
-                if newly_arrived:
-                    for p in newly_arrived:
-                        p.status = "Ready"
-                        ready_queue.append(p)
-                    # Re-sort ready queue if a preemptive algorithm is used and new processes arrived
-                    if ready_queue and "Preemptive" in scheduler_type:
-                        if "SJF" in scheduler_type:
-                            ready_queue.sort(key=lambda p: p.remaining)
-                        elif "Priority" in scheduler_type:
-                            ready_queue.sort(key=lambda p: (p.priority, p.arrival))
-
-                # Check if CPU is idle AND there are no more processes waiting to arrive BUT queue is empty
-                # This means we might have finished all processes but loop condition hasn't updated
-                if not current_process and not ready_queue and all(p.status == "Completed" or p.arrival > self.current_time for p in processes_to_schedule):
-                     # If there are processes that haven't arrived yet, advance time to next arrival
-                     future_arrivals = [p.arrival for p in processes_to_schedule if p.arrival > self.current_time]
-                     if future_arrivals:
-                           next_arrival_time = min(future_arrivals)
-                           idle_duration = next_arrival_time - self.current_time
-                           # Add Idle block to Gantt
-                           if self.gantt_data and self.gantt_data[-1][0] == "Idle":
-                               last_entry = self.gantt_data[-1]
-                               self.gantt_data[-1] = (last_entry[0], last_entry[1], last_entry[2] + idle_duration, last_entry[3])
-                           else:
-                               self.gantt_data.append(("Idle", self.current_time, idle_duration, "#E0E0E0")) # Grey for idle
-                           self.current_time = next_arrival_time
-                           if live: # Update UI if live during idle skip
-                               self.root.after(0, self.update_ui, self.gantt_data, self.active_processes)
-                               time.sleep(0.1) # Small sleep to allow UI update
-                           continue # Skip to next iteration to add the newly arrived process
-                     else:
-                           # No future arrivals, and queue is empty, must be done
-                           break # Exit the main simulation loop
-
-                # 2. Decide which process runs next (or if CPU is idle)
-
-                # Add the previously running process back to ready queue if it was preempted (Preemptive SJF/Priority only)
-                # RR handles its own requeueing after its quantum block.
-                if current_process and current_process.status == "Running" and current_process.remaining > 0:
-                    if "Preemptive" in scheduler_type: # Check if a preemptive algorithm is running
-                        current_process.status = "Ready"
-                        ready_queue.append(current_process)
-                        # Re-sort after adding back
-                        if "SJF" in scheduler_type:
-                            ready_queue.sort(key=lambda p: p.remaining)
-                        elif "Priority" in scheduler_type:
-                            ready_queue.sort(key=lambda p: (p.priority, p.arrival))
-                        current_process = None # Clear current process as it needs re-selection/confirmation
-
-                # --- Sort the ready queue based on the algorithm (if needed and not RR) ---
-                # Sorting for preemptive done above or when selecting. Non-preemptive selects once.
-                # FCFS relies on arrival order (often implicit by append order if checked correctly)
-                if ready_queue and not current_process: # Only sort/select if CPU is idle
-                     if scheduler_type == "FCFS":
-                         ready_queue.sort(key=lambda p: p.arrival) # Ensure FCFS order
-                     elif scheduler_type == "SJF Non-Preemptive":
-                          ready_queue.sort(key=lambda p: p.burst) # Non-preemptive uses original burst
-                     elif scheduler_type == "Priority Non-Preemptive":
-                          ready_queue.sort(key=lambda p: (p.priority, p.arrival))
-                     # Preemptive sorting already happened if needed. RR is FIFO (pop(0)).
-
-                # --- Select the next process to run ---
-                if not current_process and ready_queue: # Select only if CPU is free
-                    current_process = ready_queue.pop(0) # Take from front (works for FCFS, RR, and sorted P/SJF)
-                    current_process.status = "Running"
-                    if current_process.start_time is None:
-                        current_process.start_time = self.current_time
-
-                # 3. Execute a time slice or unit
-                if current_process:
-                    pid_str = f"P{current_process.pid}"
-                    color = current_process.color
-
-                    # --- Branch execution logic based on RR or other algorithms ---
-                    if scheduler_type == "Round Robin":
-                        # --- RR Execution Logic (Quantum Block) ---
-                        run_duration = min(current_process.remaining, quantum)
-
-                        # --- Gantt Chart Update for the block ---
-                        self.gantt_data.append((pid_str, self.current_time, run_duration, color))
-
-                        # --- Simulate Block Execution ---
-                        if live:
-                            # In live mode, simulate step-by-step for visualization
-                            for i in range(run_duration):
-                                while self.paused and self.running: time.sleep(0.1) # Allow pause within block
-                                if not self.running: return # Allow stop within block
-
-                                current_process.remaining -= 1
-                                self.current_time += 1
-
-                                # Check for new arrivals *during* the quantum slice in live mode
-                                live_newly_arrived = [p for p in processes_to_schedule
-                                                  if p.arrival == self.current_time and p.status == "Waiting"]
-                                for p in live_newly_arrived:
-                                      p.status = "Ready"
-                                      ready_queue.append(p) # Add arrivals immediately in live
-
-                                # Update UI every step in live mode
-                                # Update Gantt data duration for live display step by step
-                                current_gantt_block = list(self.gantt_data[-1])
-                                current_gantt_block[2] = i + 1 # Update duration visually
-                                self.gantt_data[-1] = tuple(current_gantt_block)
-                                self.root.after(0, self.update_ui, self.gantt_data, self.active_processes)
-                                time.sleep(1)
-
-                                if current_process.remaining == 0: break # Exit block early if finished
-
-                        else: # Static mode: Execute block instantly
-                            # Need to check for arrivals during the block even in static mode
-                            block_end_time = self.current_time + run_duration
-                            arrivals_during_block = [p for p in processes_to_schedule
-                                                     if p.arrival > self.current_time and p.arrival <= block_end_time and p.status == "Waiting"]
-                            for p in arrivals_during_block:
-                                 p.status = "Ready"
-                                 ready_queue.append(p)
-
-                            current_process.remaining -= run_duration
-                            self.current_time = block_end_time # Advance time by full duration
-
-                        # --- Post-Quantum Check ---
-                        if current_process.remaining == 0:
-                            # Process completed
-                            current_process.finish_time = self.current_time # Finish time is end of block
-                            current_process.turnaround_time = current_process.finish_time - current_process.arrival
-                            current_process.wait_time = current_process.turnaround_time - current_process.burst
-                            current_process.status = "Completed"
-                            self.completed_processes.append(current_process)
-                            for p in self.active_processes: # Update status in display list
-                                if p.pid == current_process.pid:
-                                     p.status = "Completed"; p.finish_time = current_process.finish_time
-                                     p.wait_time = current_process.wait_time; p.turnaround_time = current_process.turnaround_time
-                                     p.start_time = current_process.start_time; p.remaining = 0; break # Set remaining to 0
-                            current_process = None # CPU becomes free
-
-                        else:
-                            # Quantum expired (or finished exactly on quantum), process not finished
-                            current_process.status = "Ready"
-                            # Check for new arrivals at the exact end time of the quantum slice, before appending back
-                            exact_end_arrivals = [p for p in processes_to_schedule
-                                                  if p.arrival == self.current_time and p.status == "Waiting"]
-                            for p in exact_end_arrivals:
-                                p.status = "Ready"
-                                ready_queue.append(p)
-                            # Now append the current RR process to the end
-                            ready_queue.append(current_process)
-                            current_process = None # CPU becomes free
-
-                    else:
-                        # --- Execution Logic for FCFS, SJF, Priority (One Time Unit) ---
-                        # --- Gantt Chart Update ---
-                        if self.gantt_data and self.gantt_data[-1][0] == pid_str:
-                             last_entry = self.gantt_data[-1]
-                             self.gantt_data[-1] = (last_entry[0], last_entry[1], last_entry[2] + 1, last_entry[3])
-                        else:
-                             self.gantt_data.append((pid_str, self.current_time, 1, color))
-
-                        # --- Execute One Unit ---
-                        current_process.remaining -= 1
-
-                        # Advance time by one unit *before* checking completion for consistency
-                        self.current_time += 1
-
-                        # --- Check for Completion ---
-                        if current_process.remaining == 0:
-                            current_process.finish_time = self.current_time # Finish time is *now*
-                            current_process.turnaround_time = current_process.finish_time - current_process.arrival
-                            current_process.wait_time = current_process.turnaround_time - current_process.burst
-                            current_process.status = "Completed"
-                            self.completed_processes.append(current_process)
-                            for p in self.active_processes: # Update status in display list
-                                if p.pid == current_process.pid:
-                                     p.status = "Completed"; p.finish_time = current_process.finish_time
-                                     p.wait_time = current_process.wait_time; p.turnaround_time = current_process.turnaround_time
-                                     p.start_time = current_process.start_time; p.remaining = 0; break # Set remaining to 0
-                            current_process = None # CPU becomes free
-                        # No quantum check needed for non-RR algorithms
-                        # Preemption check happens implicitly at the start of the next loop iteration
-
-
-                else: # CPU is Idle (and no process could be selected from ready queue)
-                    # If we got here, it means ready_queue was empty, but maybe processes will arrive later.
-                    # Advance time by 1 unit and add Idle block. The check at the start of the loop handles jumping ahead.
-                    if self.gantt_data and self.gantt_data[-1][0] == "Idle":
-                         last_entry = self.gantt_data[-1]
-                         self.gantt_data[-1] = (last_entry[0], last_entry[1], last_entry[2] + 1, last_entry[3])
-                    else:
-                         self.gantt_data.append(("Idle", self.current_time, 1, "#E0E0E0"))
-                    self.current_time += 1
-
-
-                # 5. Update UI (if live and NOT RR, as RR updates within its block)
-                if live and scheduler_type != "Round Robin":
-                    self.root.after(0, self.update_ui, self.gantt_data, self.active_processes)
-                    time.sleep(1)
-
+                if self.seek_target is not None:
+                    # Compute the state at the target at full speed, then resume animating from there
+                    target, self.seek_target = self.seek_target, None
+                    engine.seek(target)
+                    self.current_time = engine.current_time
+                    self.root.after(0, self.update_ui, self.gantt_data, self.active_processes, GANTT_WINDOW)
+                    self.root.after(0, self.gantt_chart.xview_moveto, 1.0) # Gantt ends at the seek time
+                    continue
+
+                if engine.idle:
+                    engine.advance() # Skip straight to the next arrival
+                    self.current_time = engine.current_time
+                    self.root.after(0, self.update_ui, self.gantt_data, self.active_processes, GANTT_WINDOW)
+                    time.sleep(0.1) # Small sleep to allow UI update
+                    continue
+
+                # In live mode, simulate step-by-step for visualization
+                engine.advance(until=engine.current_time + 1)
+                self.current_time = engine.current_time
+                self.root.after(0, self.update_ui, self.gantt_data, self.active_processes, GANTT_WINDOW)
+                time.sleep(1)
 
             # Simulation finished
             # One final UI update for static mode or if live mode ended abruptly
@@ -668,8 +1141,12 @@ class SchedulerApp:
         messagebox.showinfo("Simulation Complete", f"Simulation finished at time {self.current_time}.")
 
 
-    def update_ui(self, gantt_data, process_list):
-        """Updates Gantt chart and process table. Called from scheduler thread via root.after."""
+    def update_ui(self, gantt_data, process_list, window=None):
+        """Updates Gantt chart and process table. Called from scheduler thread via root.after.
+
+        `window` limits the chart to the last that many time units (used for live redraws);
+        None draws the whole timeline.
+        """
         # Check if root window still exists
         if not self.root.winfo_exists():
             self.running = False # Stop simulation if window closed
@@ -687,12 +1164,16 @@ class SchedulerApp:
         if gantt_data:
              max_time = gantt_data[-1][1] + gantt_data[-1][2] # End time of the last block
 
+        # Live redraws only draw the recent window, so long runs don't redraw from t=0 every tick
+        window_start = max(0, max_time - window) if window else 0
+        window_span = max_time - window_start
+
         # Use a reasonable minimum width for the canvas content
-        min_canvas_width = max(max_time * 15, 500) # Ensure at least 500px or 15px per time unit
+        min_canvas_width = max(window_span * 15, 500) # Ensure at least 500px or 15px per time unit
         self.gantt_chart.config(scrollregion=(0, 0, min_canvas_width + 20, 80)) # Update scroll region (+20 padding)
 
         canvas_width = min_canvas_width # Use calculated content width for scale
-        scale = canvas_width / max_time if max_time > 0 else 1
+        scale = canvas_width / window_span if window_span > 0 else 1
         bar_height = 45 # Slightly smaller bar
         y_offset = 10
         x_offset = 10
@@ -700,9 +1181,14 @@ class SchedulerApp:
         last_time_label_pos = -100 # Initialize to ensure first label draws
         min_label_spacing_pixels = 25 # Minimum pixels between time labels
 
-        for pid_str, start_time, duration, color in gantt_data:
-            x1 = x_offset + start_time * scale
-            x2 = x_offset + (start_time + duration) * scale
+        # Walk back from the end to the first block that reaches into the window
+        first = len(gantt_data)
+        while first > 0 and gantt_data[first - 1][1] + gantt_data[first - 1][2] > window_start:
+            first -= 1
+
+        for pid_str, start_time, duration, color in gantt_data[first:]:
+            x1 = x_offset + (max(start_time, window_start) - window_start) * scale # Clip a block cut by the window
+            x2 = x_offset + (start_time + duration - window_start) * scale
             # Ensure minimum width for visibility, especially for duration 1 at small scales
             display_width = max(x2 - x1, 1.5)
             self.gantt_chart.create_rectangle(x1, y_offset, x1 + display_width, y_offset + bar_height,
@@ -718,12 +1204,12 @@ class SchedulerApp:
         # Draw time markers more sparsely if needed
         time_marker_y = y_offset + bar_height + 5
         time_label_y = time_marker_y + 5
-        for t in range(max_time + 1):
-             x = x_offset + t * scale
+        for t in range(window_start, max_time + 1):
+             x = x_offset + (t - window_start) * scale
              # Draw tick mark
              self.gantt_chart.create_line(x, y_offset + bar_height, x, time_marker_y, fill="#666666")
              # Draw time label conditionally based on spacing
-             if x >= last_time_label_pos + min_label_spacing_pixels or t == 0 or t == max_time:
+             if x >= last_time_label_pos + min_label_spacing_pixels or t == window_start or t == max_time:
                  self.gantt_chart.create_text(x, time_label_y, text=str(t),
                                             anchor=tk.N, font=("Helvetica", 8), fill="#333333")
                  last_time_label_pos = x
@@ -735,7 +1221,7 @@ class SchedulerApp:
 
 
     def show_stats(self):
-        """Calculates and displays average waiting and turnaround times."""
+        """Calculates and displays average waiting, turnaround and response times plus utilization."""
         # Use completed_processes list which should have final calculated values
         if not self.completed_processes:
             self.stats.config(text="Avg Waiting Time: - | Avg Turnaround Time: -")
@@ -747,21 +1233,446 @@ class SchedulerApp:
              self.stats.config(text="Avg Waiting Time: - | Avg Turnaround Time: -")
              return
 
-        total_wt = sum(p.wait_time for p in actually_completed)
-        total_tt = sum(p.turnaround_time for p in actually_completed)
-        n = len(actually_completed)
+        m = compute_metrics(self.engine)
+        text = (f"Avg Waiting Time: {m['avg_wait']:.2f} | Avg Turnaround Time: {m['avg_turnaround']:.2f} | "
+                f"Avg Response Time: {m['avg_response']:.2f} | CPU Utilization: {m['cpu_utilization']:.0%}")
+        if any(len(p.bursts) > 1 for p in actually_completed):
+            text += f"\nAvg I/O Wait: {m['avg_io_wait']:.2f} | I/O Utilization: {m['io_utilization']:.0%}"
+        self.stats.config(text=text)
+
+    def export_results(self):
+        """Saves the last run's per-process results and Gantt segments as CSV or NumPy .npz."""
+        if self.running:
+            messagebox.showwarning("Warning", "Wait for the simulation to finish before exporting.")
+            return
+        if not self.gantt_data:
+            messagebox.showinfo("Info", "No simulation results to export.")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Export Results", defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("NumPy archive", "*.npz")])
+        if not path:
+            return
+        try:
+            if path.lower().endswith(".npz"):
+                export_npz(self.active_processes, self.gantt_data, path)
+                saved = path
+            else:
+                # CSV has one table per file: <name>_processes.csv and <name>_gantt.csv
+                stem = os.path.splitext(path)[0]
+                export_csv(self.active_processes, self.gantt_data, f"{stem}_processes.csv", f"{stem}_gantt.csv")
+                saved = f"{stem}_processes.csv\n{stem}_gantt.csv"
+        except (ImportError, OSError) as e:
+            messagebox.showerror("Export Error", str(e))
+            return
+        messagebox.showinfo("Export Complete", f"Results saved to:\n{saved}")
+
+    # ==========================================================================
+    # COMPARE ALL ALGORITHMS
+    # ==========================================================================
+    def compare_all(self):
+        """Runs every algorithm on the current processes in worker processes and shows them side by side."""
+        if not self.input_processes:
+            messagebox.showerror("Error", "No processes added to simulate.")
+            return
+        try:
+            quantum = int(self.quantum_entry.get())
+            if quantum <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Input Error", "Round Robin needs a positive integer Quantum to compare.")
+            return
+        io_devices = self.read_io_devices()
+        if io_devices is None:
+            return
+
+        specs = [{"pid": p.pid, "arrival": p.arrival, "bursts": list(p.bursts), "priority": p.priority, "color": p.color}
+                 for p in self.input_processes]
+        has_priorities = all(p.priority is not None for p in self.input_processes)
+
+        if self.compare_pool is None:
+            self.start_compare_pool()
+        self.compare_run += 1
+        self.compare_results = {}
+        # No run can take longer than doing every burst back to back after the last arrival
+        horizon = max(p.arrival for p in self.input_processes) + sum(sum(p.bursts) for p in self.input_processes)
+        self.compare_scale = min(max(15, 500 / horizon), COMPARE_MAX_LANE_WIDTH / horizon)
+        self.open_compare_window()
+
+        for scheduler_type in SCHEDULER_TYPES:
+            if "Priority" in scheduler_type and not has_priorities:
+                self.compare_table.item(scheduler_type, values=(scheduler_type, "Needs a priority for every process"))
+                continue
+            job = (run_comparison_job, specs, scheduler_type, quantum, io_devices)
+            try:
+                future = self.compare_pool.submit(*job)
+            except concurrent.futures.process.BrokenProcessPool:
+                # A worker died during an earlier run and took the pool with it; start over with a fresh one
+                self.start_compare_pool()
+                future = self.compare_pool.submit(*job)
+            # Done callbacks run on an executor thread; hand the result to the Tk thread
+            future.add_done_callback(lambda f, run=self.compare_run, scheduler_type=scheduler_type:
+                                     self.root.after(0, self.show_comparison_result, run, scheduler_type, f))
+
+    def start_compare_pool(self):
+        """(Re)creates the worker pool used by Compare All, discarding a broken one."""
+        if self.compare_pool is not None:
+            self.compare_pool.shutdown(wait=False, cancel_futures=True)
+        # Spawn rather than fork: this process runs Tk and possibly the scheduler thread
+        self.compare_pool = concurrent.futures.ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+    def open_compare_window(self):
+        """Creates (or resets) the comparison window with one Gantt lane and one table row per algorithm."""
+        if self.compare_window is None or not self.compare_window.winfo_exists():
+            self.compare_window = tk.Toplevel(self.root)
+            self.compare_window.title("Algorithm Comparison")
+            self.compare_window.geometry("1000x550")
+            self.compare_window.configure(bg="#e0f7fa")
+
+            tk.Label(self.compare_window, text="Gantt Charts", font=("Helvetica", 14, "bold"),
+                     bg="#e0f7fa", fg="#00695c").pack(pady=(5,0))
+            lanes_frame = tk.Frame(self.compare_window, bg="#ffffff", bd=2, relief=tk.SUNKEN)
+            lanes_frame.pack(pady=5, padx=10, fill=tk.BOTH, expand=True)
+            self.compare_canvas = tk.Canvas(lanes_frame, bg="white", height=280)
+            lanes_hsb = ttk.Scrollbar(lanes_frame, orient=tk.HORIZONTAL, command=self.compare_canvas.xview)
+            self.compare_canvas.configure(xscrollcommand=lanes_hsb.set)
+            lanes_hsb.pack(side=tk.BOTTOM, fill=tk.X)
+            self.compare_canvas.pack(fill=tk.BOTH, expand=True)
+
+            tk.Label(self.compare_window, text="Metrics", font=("Helvetica", 14, "bold"),
+                     bg="#e0f7fa", fg="#00695c").pack(pady=(5,0))
+            cols = ("Algorithm", "Avg Wait", "P50 Wait", "P95 Wait", "Avg Turnaround", "P50 Turnaround",
+                    "P95 Turnaround", "Throughput", "Context Switches")
+            self.compare_table = ttk.Treeview(self.compare_window, columns=cols, show="headings", height=6)
+            for col in cols:
+                self.compare_table.heading(col, text=col, anchor=tk.CENTER)
+                self.compare_table.column(col, width=180 if col == "Algorithm" else 95, anchor=tk.CENTER, stretch=tk.NO)
+            self.compare_table.pack(pady=5, padx=10, fill=tk.X)
+
+        self.compare_canvas.delete("all")
+        self.compare_canvas.config(scrollregion=(0, 0, COMPARE_LABEL_WIDTH + 500, self.comparison_lane_top(len(SCHEDULER_TYPES)) + 10))
+        self.compare_table.delete(*self.compare_table.get_children())
+        for lane, scheduler_type in enumerate(SCHEDULER_TYPES):
+            self.compare_canvas.create_text(5, self.comparison_lane_top(lane) + COMPARE_LANE_HEIGHT / 2, text=scheduler_type,
+                                            anchor=tk.W, font=("Helvetica", 9, "bold"), fill="#00695c")
+            self.compare_table.insert("", tk.END, iid=scheduler_type, values=(scheduler_type, "Running..."))
+        self.compare_window.lift()
+
+    def show_comparison_result(self, run, scheduler_type, future):
+        """Fills in one algorithm's lane and table row. Called on the Tk thread via root.after."""
+        if run != self.compare_run or self.compare_window is None or not self.compare_window.winfo_exists():
+            return # Stale result or window closed
+        try:
+            result = future.result()
+        except concurrent.futures.process.BrokenProcessPool as e:
+            # A worker died (e.g. killed or out of memory); every job still in the pool fails the same way
+            self.compare_table.item(scheduler_type, values=(scheduler_type, "Worker crashed"))
+            if self.compare_pool is not None:
+                self.compare_pool.shutdown(wait=False, cancel_futures=True)
+                self.compare_pool = None # Rebuilt on the next Compare All
+                messagebox.showerror("Runtime Error", f"A comparison worker process crashed: {e}")
+            return
+        except Exception as e:
+            traceback.print_exc()
+            result = {"scheduler": scheduler_type, "error": str(e)}
+        if "error" in result:
+            self.compare_table.item(scheduler_type, values=(scheduler_type, result["error"]))
+            return
+
+        m = result["metrics"]
+        self.compare_table.item(scheduler_type, values=(
+            scheduler_type, f"{m['avg_wait']:.2f}", m["p50_wait"], m["p95_wait"], f"{m['avg_turnaround']:.2f}",
+            m["p50_turnaround"], m["p95_turnaround"], f"{m['throughput']:.3f}", m["context_switches"]))
+        self.compare_results[scheduler_type] = result
+        self.draw_comparison_lane(scheduler_type, result["gantt"])
+        max_time = max(r["metrics"]["makespan"] for r in self.compare_results.values())
+        self.compare_canvas.config(scrollregion=(0, 0, COMPARE_LABEL_WIDTH + max(max_time * self.compare_scale, 500) + 20,
+                                                 self.comparison_lane_top(len(SCHEDULER_TYPES)) + 10))
+
+    @staticmethod
+    def comparison_lane_top(lane):
+        """Canvas y of the top of a comparison lane; lanes keep the fixed algorithm order."""
+        return 10 + lane * (COMPARE_LANE_HEIGHT + 12)
+
+    def draw_comparison_lane(self, scheduler_type, gantt):
+        """Draws one algorithm's Gantt lane at the comparison's fixed scale.
+
+        Neighbouring blocks that together are still narrower than COMPARE_MIN_BLOCK_WIDTH are drawn as
+        one grey block, so a long run costs at most one rectangle per pixel or two of lane width.
+        """
+        y1 = self.comparison_lane_top(SCHEDULER_TYPES.index(scheduler_type))
+        scale = self.compare_scale
+
+        def draw(x1, x2, pid_str, color):
+            display_width = max(x2 - x1, COMPARE_MIN_BLOCK_WIDTH)
+            self.compare_canvas.create_rectangle(x1, y1, x1 + display_width, y1 + COMPARE_LANE_HEIGHT,
+                                                 fill=color, outline="#333333", width=1)
+            if display_width > 15: # Only add text if width is > 15 pixels
+                self.compare_canvas.create_text(x1 + display_width / 2, y1 + COMPARE_LANE_HEIGHT / 2,
+                                                text=pid_str, fill="black", font=("Helvetica", 8, "bold"))
+
+        pending = None # [x1, x2, pid_str, color] of the block not drawn yet
+        for pid_str, start_time, duration, color in gantt:
+            x1 = COMPARE_LABEL_WIDTH + start_time * scale
+            x2 = x1 + duration * scale
+            if pending is not None and x2 - pending[0] < COMPARE_MIN_BLOCK_WIDTH:
+                pending[1] = x2
+                if pending[2] != pid_str:
+                    pending[3] = "#9E9E9E" # Several processes share these pixels
+                continue
+            if pending is not None:
+                draw(*pending)
+            pending = [x1, x2, pid_str, color]
+        if pending is not None:
+            draw(*pending)
+
+# ==========================================================================
+# Headless simulation service
+# ==========================================================================
+STREAM_CHUNK_LINES = 2048 # NDJSON lines per chunk written back to the client
+MAX_REQUEST_BYTES = 64 * 1024 * 1024 # Longest accepted request line
+REPLY_DRAIN_TIMEOUT = 30 # Seconds a client may leave its reply unread before it is disconnected
+
+
+def error_line(request_id, message):
+    """One NDJSON "error" reply line."""
+    return (json.dumps({"id": request_id, "type": "error", "message": message}) + "\n").encode()
+
+
+def service_reply(request):
+    """Simulates one request and yields the reply as NDJSON byte chunks of STREAM_CHUNK_LINES lines.
+
+    Gantt segments are emitted while the simulation runs, as soon as a later segment shows they can
+    no longer grow, so the first chunk is ready long before a large run finishes.
+    """
+    request_id = request.get("id")
+    try:
+        engine = build_engine(request.get("processes", []), request.get("algorithm", "FCFS"), request.get("quantum"),
+                              request.get("io_devices", 1))
+    except ValueError as e:
+        yield error_line(request_id, str(e))
+        return
+
+    lines = []
+    sent = 0 # Gantt segments already turned into lines
+
+    def segment_lines(end):
+        for pid_str, start_time, duration, _ in engine.gantt_data[sent:end]:
+            lines.append(json.dumps({"id": request_id, "type": "segment", "pid": pid_str, "start": start_time,
+                                     "duration": duration}))
+
+    while not engine.finished:
+        engine.advance()
+        if len(engine.gantt_data) - 1 - sent >= STREAM_CHUNK_LINES: # The last segment may still be extended
+            segment_lines(len(engine.gantt_data) - 1)
+            sent = len(engine.gantt_data) - 1
+            yield ("\n".join(lines) + "\n").encode()
+            lines.clear()
+    segment_lines(len(engine.gantt_data))
+
+    for p in sorted(engine.processes, key=lambda p: p.pid):
+        lines.append(json.dumps({"id": request_id, "type": "process", "pid": p.pid, "arrival": p.arrival,
+                                 "burst": p.burst, "io": p.io_time, "start": p.start_time, "finish": p.finish_time,
+                                 "wait": p.wait_time, "turnaround": p.turnaround_time,
+                                 "response": p.start_time - p.arrival, "io_wait": p.io_wait_time}))
+        if len(lines) >= STREAM_CHUNK_LINES:
+            yield ("\n".join(lines) + "\n").encode()
+            lines.clear()
+    lines.append(json.dumps({"id": request_id, "type": "metrics", **compute_metrics(engine)}))
+    lines.append(json.dumps({"id": request_id, "type": "done"}))
+    yield ("\n".join(lines) + "\n").encode()
+
+
+reply_queue = None # Set in each service worker: where finished chunks go back to the server
+
+
+def init_service_worker(replies):
+    """Service worker initializer. Workers ignore Ctrl+C; the executor shuts them down when the server stops."""
+    global reply_queue
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    reply_queue = replies
+
+
+def run_service_job(job_id, request):
+    """Worker-process entry point: streams one reply to the server as (job_id, chunk) items.
+
+    The JSON is encoded in the worker so the server's event loop only copies bytes to sockets.
+    (job_id, None) always ends the reply.
+    """
+    try:
+        for chunk in service_reply(request):
+            reply_queue.put((job_id, chunk))
+    except Exception as e: # e.g. malformed fields the validation did not expect
+        reply_queue.put((job_id, error_line(request.get("id"), f"Simulation failed: {e}")))
+    finally:
+        reply_queue.put((job_id, None))
+
+
+async def serve(socket_path, workers=None, max_in_flight=None, max_replies=None, drain_timeout=REPLY_DRAIN_TIMEOUT):
+    """Serves simulation requests over a Unix domain socket until cancelled or stopped by SIGINT/SIGTERM.
+
+    Each request is one JSON line: {"id", "algorithm", "quantum", "io_devices",
+    "processes": [{pid, arrival, burst (or bursts), priority}]}.
+    The reply is NDJSON: "segment" lines, then "process" lines, a "metrics" line and a "done" line
+    (or a single "error" line). Requests on one connection are answered in order; use several
+    connections for concurrency.
+
+    Replies stream back from the workers while they simulate. At most `max_in_flight` jobs are
+    queued for or running on a worker, and a job gives its worker slot back as soon as it ends.
+    Separately, at most `max_replies` replies are in progress (each may be buffered in full for a
+    slow reader), and a client that doesn't read for `drain_timeout` seconds is disconnected.
+    """
+    loop = asyncio.get_running_loop()
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    worker_slots = asyncio.Semaphore(max_in_flight)
+    reply_slots = asyncio.Semaphore(max_replies or 4 * max_in_flight)
+    streams = {} # job_id -> asyncio.Queue of chunks for the connection waiting on that job
+    job_ids = itertools.count()
+    connections = set()
+
+    def deliver(job_id, chunk):
+        stream = streams.get(job_id)
+        if stream is not None: # Otherwise the client is gone and the chunk is dropped
+            stream.put_nowait(chunk)
+
+    def forward_replies():
+        # Runs in a thread: hands chunks from the workers' queue to the event loop
+        while True:
+            item = replies.get()
+            if item is None:
+                return
+            loop.call_soon_threadsafe(deliver, *item)
+
+    def job_done(job_id, request_id, future):
+        worker_slots.release()
+        if future.cancelled() or future.exception() is not None:
+            # The worker never finished the reply (it died, or the server is shutting down)
+            reason = "cancelled" if future.cancelled() else future.exception()
+            deliver(job_id, error_line(request_id, f"Simulation failed: {reason}"))
+            deliver(job_id, None)
+
+    async def send(writer, chunk):
+        writer.write(chunk)
+        await asyncio.wait_for(writer.drain(), drain_timeout)
+
+    async def reply(writer, request):
+        job_id = next(job_ids)
+        stream = streams[job_id] = asyncio.Queue()
+        try:
+            await worker_slots.acquire()
+            try:
+                future = loop.run_in_executor(pool, run_service_job, job_id, request)
+            except Exception as e: # e.g. the pool is broken
+                worker_slots.release()
+                await send(writer, error_line(request.get("id"), f"Simulation failed: {e}"))
+                return
+            future.add_done_callback(functools.partial(job_done, job_id, request.get("id")))
+            while True:
+                chunk = await stream.get()
+                if chunk is None:
+                    return
+                await send(writer, chunk)
+        finally:
+            del streams[job_id]
+
+    async def handle_client(reader, writer):
+        connections.add(asyncio.current_task())
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError: # Request longer than MAX_REQUEST_BYTES
+                    await send(writer, b'{"id": null, "type": "error", "message": "Request too large."}\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("Request must be a JSON object.")
+                except ValueError as e:
+                    await send(writer, error_line(None, f"Bad request: {e}"))
+                    continue
+                async with reply_slots:
+                    await reply(writer, request)
+        except asyncio.TimeoutError:
+            writer.transport.abort() # Client stopped reading; drop it along with anything still buffered
+        except (ConnectionResetError, BrokenPipeError):
+            pass # Client went away
+        except asyncio.CancelledError:
+            pass # Server is shutting down
+        except Exception as e:
+            print(f"Error while serving client: {e}")
+            traceback.print_exc()
+        finally:
+            writer.close()
+            connections.discard(asyncio.current_task())
+
+    # Remove a socket left behind by a previous run, but never a regular file
+    if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+        os.unlink(socket_path)
+
+    # Forked workers would be created on the first request, from inside the running event loop, and
+    # inherit the client socket open at that moment (plus the listening socket and the loop's epoll fd),
+    # so that client would never see EOF. A fork server starts them from a clean process instead.
+    context = multiprocessing.get_context("forkserver")
+    replies = context.SimpleQueue()
+    forwarder = Thread(target=forward_replies, daemon=True)
+    forwarder.start()
+    pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                                  initializer=init_service_worker, initargs=(replies,))
+    try:
+        server = await asyncio.start_unix_server(handle_client, path=socket_path, limit=MAX_REQUEST_BYTES)
+        print(f"Serving simulations on {socket_path} with {workers} workers")
+        stop_signals = ()
+        if current_thread() is main_thread():
+            # Ctrl+C or SIGTERM closes the server. Going through the loop (rather than the default
+            # KeyboardInterrupt) also wakes it when the signal lands on one of the pool's threads.
+            stop_signals = (signal.SIGINT, signal.SIGTERM)
+            for signum in stop_signals:
+                loop.add_signal_handler(signum, server.close)
+        async with server:
+            try:
+                await server.serve_forever()
+            except asyncio.CancelledError:
+                if server.is_serving():
+                    raise # Cancelled by the caller rather than stopped by a signal
+            finally:
+                for signum in stop_signals:
+                    loop.remove_signal_handler(signum)
+                # Close open connections quietly instead of leaving them to be cancelled by asyncio.run
+                for task in list(connections):
+                    task.cancel()
+                await asyncio.gather(*connections, return_exceptions=True)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        replies.put(None) # Stops the forwarder thread
+        forwarder.join()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
 
-        if n > 0:
-            avg_wt = total_wt / n
-            avg_tt = total_tt / n
-            self.stats.config(text=f"Avg Waiting Time: {avg_wt:.2f} | Avg Turnaround Time: {avg_tt:.2f}")
-        else:
-            self.stats.config(text="Avg Waiting Time: 0.00 | Avg Turnaround Time: 0.00")
 
 # ==========================================================================
 # Main execution
 # ==========================================================================
 if __name__ == "__main__":
+    # Needed by the Compare All worker pool when running as a frozen (PyInstaller) executable
+    multiprocessing.freeze_support()
+    parser = argparse.ArgumentParser(description="CPU Scheduler Simulator")
+    parser.add_argument("--serve", metavar="SOCKET", help="run the headless simulation service on this Unix socket path")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes for --serve (default: CPU count)")
+    args = parser.parse_args()
+    if args.serve:
+        try:
+            asyncio.run(serve(args.serve, workers=args.workers))
+        except KeyboardInterrupt:
+            pass
+        raise SystemExit(0)
+
+    load_gui_toolkit()
     root = tk.Tk()
     # Apply a theme for better widget appearance
     try:
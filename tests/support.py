@@ -0,0 +1,41 @@
+"""Helpers shared by the test modules: imports OS from "Source Code" and builds processes and runs."""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Source Code"))
+import OS # noqa: E402
+
+# Textbook example: (pid, arrival, burst, priority), lower priority number = higher priority
+EXAMPLE = [(1, 0, 7, 2), (2, 2, 4, 1), (3, 4, 1, 3), (4, 5, 4, 0)]
+
+
+def make_processes(specs):
+    return [OS.Process(*spec) for spec in specs]
+
+
+def random_specs(seed, count, max_arrival, io=False):
+    rng = random.Random(seed)
+    specs = []
+    for pid in range(1, count + 1):
+        bursts = [rng.randint(1, 6) for _ in range(2 * rng.randint(0, 2) + 1)] if io else rng.randint(1, 9)
+        specs.append((pid, rng.randint(0, max_arrival), bursts, rng.randint(0, 4)))
+    return specs
+
+
+def step_live(engine):
+    """Drives the engine the way the GUI's live mode does, one time unit per step."""
+    while not (engine.finished and engine.close()):
+        if engine.idle:
+            engine.advance()
+        else:
+            engine.advance(until=engine.current_time + 1)
+
+
+def signature(engine):
+    """Everything observable about a run, minus the random colors."""
+    return (engine.current_time,
+            [block[:3] for block in engine.gantt_data],
+            sorted((p.pid, p.arrival, p.phase, p.remaining, p.status, p.start_time, p.finish_time,
+                    p.wait_time, p.io_wait_time) for p in engine.processes))
+
@@ -0,0 +1,84 @@
+"""Tests for the run metrics and the Compare All worker job."""
+import concurrent.futures
+import multiprocessing
+import unittest
+
+from support import EXAMPLE, OS, make_processes
+
+
+def example_specs(with_priority=True):
+    return [{"pid": pid, "arrival": arrival, "burst": burst, "priority": priority if with_priority else None}
+            for pid, arrival, burst, priority in EXAMPLE]
+
+
+class PercentileTests(unittest.TestCase):
+    """Nearest-rank percentiles."""
+
+    def test_nearest_rank(self):
+        values = [35, 20, 50, 15, 40] # Sorted: 15, 20, 35, 40, 50
+        self.assertEqual([OS.percentile(values, q) for q in (0, 5, 30, 40, 50, 95, 100)], [15, 15, 20, 20, 35, 50, 50])
+
+    def test_empty(self):
+        self.assertEqual(OS.percentile([], 95), 0.0)
+
+
+class MetricsTests(unittest.TestCase):
+    """compute_metrics on EXAMPLE, checked against values worked out by hand."""
+
+    def metrics(self, scheduler_type, quantum=None, specs=EXAMPLE):
+        engine = OS.SchedulerEngine(make_processes(specs), scheduler_type, quantum)
+        engine.run()
+        return OS.compute_metrics(engine)
+
+    def test_fcfs(self):
+        m = self.metrics("FCFS")
+        # Waits 0, 5, 7, 7; turnarounds 7, 9, 8, 11; four processes done by t=16
+        self.assertEqual((m["completed"], m["makespan"], m["throughput"]), (4, 16, 0.25))
+        self.assertEqual((m["avg_wait"], m["p50_wait"], m["p95_wait"]), (4.75, 5, 7))
+        self.assertEqual((m["avg_turnaround"], m["p50_turnaround"], m["p95_turnaround"]), (8.75, 8, 11))
+        self.assertEqual(m["context_switches"], 3)
+        self.assertEqual(m["cpu_utilization"], 1.0)
+
+    def test_round_robin(self):
+        m = self.metrics("Round Robin", quantum=2)
+        # Nine blocks, each a different process from the one before; waits 9, 3, 2, 6
+        self.assertEqual(m["context_switches"], 8)
+        self.assertEqual((m["avg_wait"], m["p50_wait"], m["p95_wait"]), (5.0, 3, 9))
+        self.assertEqual(m["throughput"], 0.25)
+
+    def test_idle_is_not_a_context_switch(self):
+        m = self.metrics("FCFS", specs=[(1, 2, 3), (2, 8, 1)]) # Idle 0-2, P1 2-5, Idle 5-8, P2 8-9
+        self.assertEqual(m["context_switches"], 1)
+        self.assertEqual(m["throughput"], 2 / 9)
+        self.assertEqual(m["cpu_utilization"], 4 / 9)
+
+
+class ComparisonJobTests(unittest.TestCase):
+    """The per-algorithm job that Compare All runs in worker processes."""
+
+    def test_result(self):
+        result = OS.run_comparison_job(example_specs(), "SJF Preemptive", 2)
+        self.assertEqual(result["scheduler"], "SJF Preemptive")
+        self.assertEqual([block[:3] for block in result["gantt"]],
+                         [("P1", 0, 2), ("P2", 2, 2), ("P3", 4, 1), ("P2", 5, 2), ("P4", 7, 4), ("P1", 11, 5)])
+        self.assertEqual((result["metrics"]["avg_wait"], result["metrics"]["context_switches"]), (3.0, 5))
+
+    def test_priority_without_priorities_is_an_error(self):
+        result = OS.run_comparison_job(example_specs(with_priority=False), "Priority Preemptive", 2)
+        self.assertEqual(set(result), {"scheduler", "error"})
+
+    def test_every_algorithm_in_a_spawned_pool(self):
+        context = multiprocessing.get_context("spawn") # As the GUI runs it
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+            futures = {scheduler_type: pool.submit(OS.run_comparison_job, example_specs(), scheduler_type, 2)
+                       for scheduler_type in OS.SCHEDULER_TYPES}
+            for scheduler_type, future in futures.items():
+                with self.subTest(scheduler_type=scheduler_type):
+                    expected = OS.run_comparison_job(example_specs(), scheduler_type, 2)
+                    result = future.result(timeout=60)
+                    self.assertEqual([block[:3] for block in result["gantt"]], [block[:3] for block in expected["gantt"]])
+                    self.assertEqual(result["metrics"], expected["metrics"])
+
+
+if __name__ == "__main__":
+    unittest.main()
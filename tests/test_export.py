@@ -0,0 +1,64 @@
+"""Tests for CSV and .npz export of results."""
+import csv
+import os
+import sys
+import tempfile
+import unittest
+
+from support import OS, make_processes
+
+
+class ExportTests(unittest.TestCase):
+    """CSV and .npz export of results."""
+
+    def setUp(self):
+        self.engine = OS.SchedulerEngine(make_processes([(1, 0, [2, 3, 2]), (2, 1, 4), (3, 20, 1)]), "FCFS")
+        self.engine.run()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_csv(self):
+        processes_path = os.path.join(self.directory.name, "run_processes.csv")
+        gantt_path = os.path.join(self.directory.name, "run_gantt.csv")
+        OS.export_csv(self.engine.processes, self.engine.gantt_data, processes_path, gantt_path)
+
+        with open(processes_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(list(rows[0]), list(OS.PROCESS_EXPORT_COLUMNS))
+        self.assertEqual([(row["pid"], row["finish"], row["wait"], row["io"]) for row in rows],
+                         [("1", "8", "1", "3"), ("2", "6", "1", "0"), ("3", "21", "0", "0")])
+
+        with open(gantt_path, newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows, [["pid", "start", "duration"], ["1", "0", "2"], ["2", "2", "4"], ["1", "6", "2"],
+                                ["-1", "8", "12"], ["3", "20", "1"]])
+
+    def test_npz(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        path = os.path.join(self.directory.name, "run.npz")
+        OS.export_npz(self.engine.processes, self.engine.gantt_data, path)
+        with np.load(path) as data:
+            self.assertEqual(data["process_wait"].tolist(), [1, 1, 0])
+            self.assertEqual(data["gantt_pid"].tolist(), [1, 2, 1, -1, 3])
+            self.assertEqual(data["gantt_start"].dtype, np.int64)
+
+    def test_npz_without_numpy(self):
+        path = os.path.join(self.directory.name, "run.npz")
+        saved = sys.modules.get("numpy")
+        sys.modules["numpy"] = None # Makes "import numpy" raise ImportError
+        try:
+            with self.assertRaises(ImportError):
+                OS.export_npz(self.engine.processes, self.engine.gantt_data, path)
+        finally:
+            if saved is None:
+                del sys.modules["numpy"]
+            else:
+                sys.modules["numpy"] = saved
+        self.assertFalse(os.path.exists(path)) # Nothing is written before numpy is found
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Tests for alternating CPU/I-O bursts and the I/O device pool."""
+import unittest
+
+from support import OS, make_processes, random_specs, signature, step_live
+
+
+class IOBurstTests(unittest.TestCase):
+    """Alternating CPU/I-O bursts and the I/O device pool."""
+
+    def test_io_frees_the_cpu(self):
+        engine = OS.SchedulerEngine(make_processes([(1, 0, [2, 3, 2]), (2, 0, 4)]), "FCFS")
+        engine.run()
+        self.assertEqual([block[:3] for block in engine.gantt_data], [("P1", 0, 2), ("P2", 2, 4), ("P1", 6, 2)])
+        p1, p2 = engine.processes
+        self.assertEqual((p1.finish_time, p1.wait_time, p1.io_time), (8, 1, 3))
+        self.assertEqual((p2.finish_time, p2.wait_time), (6, 2))
+
+    def test_single_device_queues_io(self):
+        engine = OS.SchedulerEngine(make_processes([(1, 0, [1, 5, 1]), (2, 0, [1, 5, 1])]), "FCFS")
+        engine.run()
+        p1, p2 = engine.processes
+        self.assertEqual((p1.finish_time, p1.io_wait_time), (7, 0))
+        self.assertEqual((p2.finish_time, p2.io_wait_time), (12, 4))
+        metrics = OS.compute_metrics(engine)
+        self.assertEqual(metrics["avg_io_wait"], 2.0)
+        self.assertAlmostEqual(metrics["io_utilization"], 10 / 12)
+
+    def test_more_devices_remove_io_wait(self):
+        engine = OS.SchedulerEngine(make_processes([(1, 0, [1, 5, 1]), (2, 0, [1, 5, 1])]), "FCFS", io_devices=2)
+        engine.run()
+        self.assertEqual([block[:3] for block in engine.gantt_data], [("P1", 0, 1), ("P2", 1, 1), ("Idle", 2, 4),
+                                                                       ("P1", 6, 1), ("P2", 7, 1)])
+        self.assertEqual([p.io_wait_time for p in engine.processes], [0, 0])
+
+    def test_remaining_cpu(self):
+        engine = OS.SchedulerEngine(make_processes([(1, 0, [3, 4, 2, 5, 1])]), "FCFS")
+        process = engine.processes[0]
+        seen = {}
+        while not engine.finished:
+            seen.setdefault(process.phase, process.remaining_cpu)
+            engine.advance(until=engine.current_time + 1)
+        self.assertEqual(seen, {0: 6, 1: 3, 2: 3, 3: 1, 4: 1})
+
+    def test_live_stepping_and_seek_with_io(self):
+        for scheduler_type in OS.SCHEDULER_TYPES:
+            for io_devices in (1, 3):
+                with self.subTest(scheduler_type=scheduler_type, io_devices=io_devices):
+                    specs = random_specs(7, 120, 300, io=True)
+                    static = OS.SchedulerEngine(make_processes(specs), scheduler_type, 2, io_devices=io_devices)
+                    static.run()
+                    live = OS.SchedulerEngine(make_processes(specs), scheduler_type, 2, io_devices=io_devices,
+                                              snapshot_interval=50)
+                    step_live(live)
+                    self.assertEqual(signature(live), signature(static))
+                    self.assertTrue(all(p.wait_time >= 0 and p.io_wait_time >= 0 for p in static.processes))
+
+                    reference = OS.SchedulerEngine(make_processes(specs), scheduler_type, 2, io_devices=io_devices)
+                    reference.run_until(333)
+                    live.seek(333)
+                    self.assertEqual(signature(live), signature(reference))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for submitting processes to a running engine."""
+import threading
+import unittest
+
+from support import OS, make_processes, random_specs, signature, step_live
+
+
+class OnlineSubmissionTests(unittest.TestCase):
+    """Processes submitted while running, including across seeks."""
+
+    def test_late_submission_arrives_now(self):
+        engine = OS.SchedulerEngine(make_processes([(1, 0, 5)]), "FCFS")
+        engine.run_until(3)
+        self.assertTrue(engine.submit(OS.Process(2, 0, 2)))
+        engine.run()
+        late = engine.processes[-1]
+        self.assertEqual(late.arrival, 3)
+        self.assertEqual([block[:3] for block in engine.gantt_data], [("P1", 0, 5), ("P2", 5, 2)])
+
+    def test_submissions_survive_seek(self):
+        for scheduler_type in OS.SCHEDULER_TYPES:
+            with self.subTest(scheduler_type=scheduler_type):
+                engine = OS.SchedulerEngine(make_processes(random_specs(3, 100, 300)), scheduler_type, 2,
+                                            snapshot_interval=50)
+                engine.run_until(150)
+                engine.submit_many(make_processes(random_specs(4, 200, 400)[100:]))
+                engine.run_until(220)
+                engine.submit(OS.Process(999, 0, 3, 1))
+                engine.run_until(260)
+                middle = signature(engine)
+                engine.run()
+                final = signature(engine)
+
+                engine.seek(100) # Before both submissions
+                engine.seek(260)
+                self.assertEqual(signature(engine), middle)
+                engine.run()
+                self.assertEqual(signature(engine), final)
+                self.assertEqual(len(engine.completed_processes), 201)
+
+    def test_submission_after_backward_seek(self):
+        for scheduler_type in OS.SCHEDULER_TYPES:
+            with self.subTest(scheduler_type=scheduler_type):
+                engine = OS.SchedulerEngine(make_processes(random_specs(8, 60, 300)), scheduler_type, 2,
+                                            snapshot_interval=20)
+                engine.run_until(150)
+                engine.submit(OS.Process(101, 0, 6, 1))
+                engine.run_until(220)
+                engine.submit(OS.Process(102, 0, 4, 0))
+                engine.run_until(260)
+                engine.seek(50)
+                engine.run_until(120)
+                engine.submit(OS.Process(103, 0, 5, 2)) # Branches the timeline before 101 and 102 come back
+                engine.run_until(400)
+                first = signature(engine)
+                self.assertEqual({p.pid: p.arrival for p in engine.processes if p.pid > 100}, {101: 150, 102: 220, 103: 120})
+
+                engine.seek(50)
+                engine.run_until(400)
+                self.assertEqual(signature(engine), first)
+
+    def test_submissions_while_stepping_match_offline_run(self):
+        specs = random_specs(5, 80, 200)
+        extra = make_processes(random_specs(6, 120, 300)[80:])
+        for scheduler_type in ("FCFS", "SJF Preemptive", "Priority Non-Preemptive"):
+            with self.subTest(scheduler_type=scheduler_type):
+                live = OS.SchedulerEngine(make_processes(specs), scheduler_type, 2, snapshot_interval=50)
+                while live.current_time < 150:
+                    live.advance(until=live.current_time + 1)
+                live.submit_many(OS.Process(p.pid, p.arrival, p.burst, p.priority) for p in extra)
+                step_live(live)
+                # The same jobs known up front, with their arrivals clamped to the submission time
+                offline = OS.SchedulerEngine([OS.Process(p.pid, p.arrival, p.burst, p.priority) for p in live.processes],
+                                             scheduler_type, 2)
+                offline.run()
+                self.assertEqual(signature(live)[2], signature(offline)[2])
+
+    def test_submit_after_close_is_refused(self):
+        engine = OS.SchedulerEngine(make_processes([(1, 0, 2)]), "FCFS")
+        engine.run()
+        self.assertTrue(engine.close())
+        self.assertFalse(engine.submit(OS.Process(2, 0, 1)))
+        self.assertEqual(len(engine.processes), 1)
+
+    def test_close_fails_while_submissions_are_queued(self):
+        engine = OS.SchedulerEngine(make_processes([(1, 0, 2)]), "FCFS")
+        engine.run()
+        engine.submit(OS.Process(2, 0, 1))
+        self.assertFalse(engine.close())
+        engine.run()
+        self.assertTrue(engine.close())
+        self.assertEqual(len(engine.completed_processes), 2)
+
+    def test_no_submission_is_lost_when_run_ends(self):
+        for _ in range(50):
+            engine = OS.SchedulerEngine(make_processes([(1, 0, 3)]), "FCFS")
+            accepted = []
+
+            def feeder():
+                for pid in range(100, 150):
+                    if engine.submit(OS.Process(pid, 0, 1)):
+                        accepted.append(pid)
+
+            thread = threading.Thread(target=feeder)
+            thread.start()
+            while True:
+                engine.run()
+                if engine.close():
+                    break
+            thread.join()
+            self.assertTrue(set(accepted) <= {p.pid for p in engine.completed_processes})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Regression tests for the scheduling engine: hand-computed schedules, live stepping and seeking.
+
+Run from the repository root with `python -m pytest tests` (or `python -m unittest discover tests`).
+"""
+import unittest
+
+from support import EXAMPLE, OS, make_processes, random_specs, signature, step_live
+
+
+class HandComputedScheduleTests(unittest.TestCase):
+    """Each algorithm on EXAMPLE, checked against schedules worked out by hand."""
+
+    def run_example(self, scheduler_type, quantum=None):
+        engine = OS.SchedulerEngine(make_processes(EXAMPLE), scheduler_type, quantum)
+        engine.run()
+        waits = {p.pid: p.wait_time for p in engine.processes}
+        return [block[:3] for block in engine.gantt_data], waits
+
+    def test_fcfs(self):
+        gantt, waits = self.run_example("FCFS")
+        self.assertEqual(gantt, [("P1", 0, 7), ("P2", 7, 4), ("P3", 11, 1), ("P4", 12, 4)])
+        self.assertEqual(waits, {1: 0, 2: 5, 3: 7, 4: 7})
+
+    def test_sjf_non_preemptive(self):
+        gantt, waits = self.run_example("SJF Non-Preemptive")
+        # At t=7 P3 is shortest; P2 and P4 tie on 4 and P2 arrived first
+        self.assertEqual(gantt, [("P1", 0, 7), ("P3", 7, 1), ("P2", 8, 4), ("P4", 12, 4)])
+        self.assertEqual(waits, {1: 0, 2: 6, 3: 3, 4: 7})
+
+    def test_sjf_preemptive(self):
+        gantt, waits = self.run_example("SJF Preemptive")
+        self.assertEqual(gantt, [("P1", 0, 2), ("P2", 2, 2), ("P3", 4, 1), ("P2", 5, 2), ("P4", 7, 4), ("P1", 11, 5)])
+        self.assertEqual(waits, {1: 9, 2: 1, 3: 0, 4: 2})
+
+    def test_priority_non_preemptive(self):
+        gantt, waits = self.run_example("Priority Non-Preemptive")
+        self.assertEqual(gantt, [("P1", 0, 7), ("P4", 7, 4), ("P2", 11, 4), ("P3", 15, 1)])
+        self.assertEqual(waits, {1: 0, 2: 9, 3: 11, 4: 2})
+
+    def test_priority_preemptive(self):
+        gantt, waits = self.run_example("Priority Preemptive")
+        self.assertEqual(gantt, [("P1", 0, 2), ("P2", 2, 3), ("P4", 5, 4), ("P2", 9, 1), ("P1", 10, 5), ("P3", 15, 1)])
+        self.assertEqual(waits, {1: 8, 2: 4, 3: 11, 4: 0})
+
+    def test_round_robin(self):
+        gantt, waits = self.run_example("Round Robin", quantum=2)
+        # A process arriving as a quantum expires queues ahead of the preempted one
+        self.assertEqual(gantt, [("P1", 0, 2), ("P2", 2, 2), ("P1", 4, 2), ("P3", 6, 1), ("P2", 7, 2),
+                                 ("P4", 9, 2), ("P1", 11, 2), ("P4", 13, 2), ("P1", 15, 1)])
+        self.assertEqual(waits, {1: 9, 2: 3, 3: 2, 4: 6})
+
+    def test_idle_gap(self):
+        engine = OS.SchedulerEngine(make_processes([(1, 2, 3), (2, 8, 1)]), "FCFS")
+        engine.run()
+        self.assertEqual([block[:3] for block in engine.gantt_data], [("Idle", 0, 2), ("P1", 2, 3), ("Idle", 5, 3), ("P2", 8, 1)])
+        self.assertEqual(OS.compute_metrics(engine)["makespan"], 9)
+
+
+class LiveAndSeekTests(unittest.TestCase):
+    """Static runs, live stepping and seeking must all produce the same schedule."""
+
+    def test_live_stepping_matches_static_run(self):
+        for scheduler_type in OS.SCHEDULER_TYPES:
+            with self.subTest(scheduler_type=scheduler_type):
+                specs = random_specs(1, 150, 400)
+                static = OS.SchedulerEngine(make_processes(specs), scheduler_type, 3)
+                static.run()
+                live = OS.SchedulerEngine(make_processes(specs), scheduler_type, 3, snapshot_interval=50)
+                step_live(live)
+                self.assertEqual(signature(live), signature(static))
+
+    def test_seek_matches_run_until(self):
+        specs = random_specs(2, 300, 1500)
+        for scheduler_type in OS.SCHEDULER_TYPES:
+            with self.subTest(scheduler_type=scheduler_type):
+                references = {}
+                for target in (777, 123, 1400):
+                    reference = OS.SchedulerEngine(make_processes(specs), scheduler_type, 2)
+                    reference.run_until(target)
+                    references[target] = signature(reference)
+                engine = OS.SchedulerEngine(make_processes(specs), scheduler_type, 2, snapshot_interval=100)
+                for target in (777, 123, 1400, 777):
+                    engine.seek(target)
+                    self.assertEqual(signature(engine), references[target])
+
+    def test_snapshot_count_is_capped(self):
+        engine = OS.SchedulerEngine(make_processes([(pid, pid * 50, 10) for pid in range(1, 4001)]), "FCFS",
+                                    snapshot_interval=100)
+        engine.run()
+        self.assertLessEqual(len(engine.snapshots), OS.MAX_SNAPSHOTS)
+        reference = OS.SchedulerEngine(make_processes([(pid, pid * 50, 10) for pid in range(1, 4001)]), "FCFS")
+        reference.run_until(12345)
+        engine.seek(12345)
+        self.assertEqual(signature(engine), signature(reference))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+"""Tests for the headless simulation service (--serve) and its NDJSON replies."""
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from support import EXAMPLE, OS
+
+
+def example_request(request_id=1, algorithm="FCFS"):
+    processes = [{"pid": pid, "arrival": arrival, "burst": burst, "priority": priority}
+                 for pid, arrival, burst, priority in EXAMPLE]
+    return {"id": request_id, "algorithm": algorithm, "quantum": 2, "processes": processes}
+
+
+def decode(data):
+    return [json.loads(line) for line in data.decode().splitlines()]
+
+
+class ServiceReplyTests(unittest.TestCase):
+    """The reply a worker streams back for one request."""
+
+    def test_reply(self):
+        records = decode(b"".join(OS.service_reply(example_request())))
+        self.assertEqual([(r["pid"], r["start"], r["duration"]) for r in records if r["type"] == "segment"],
+                         [("P1", 0, 7), ("P2", 7, 4), ("P3", 11, 1), ("P4", 12, 4)])
+        self.assertEqual([(r["pid"], r["wait"]) for r in records if r["type"] == "process"],
+                         [(1, 0), (2, 5), (3, 7), (4, 7)])
+        self.assertEqual([r["type"] for r in records[-2:]], ["metrics", "done"])
+        self.assertEqual(records[-2]["avg_wait"], 4.75)
+        self.assertTrue(all(r["id"] == 1 for r in records))
+
+    def test_invalid_process_gives_one_error_line(self):
+        request = {"id": 7, "algorithm": "FCFS", "processes": [{"pid": 1, "arrival": -1, "burst": 2}]}
+        records = decode(b"".join(OS.service_reply(request)))
+        self.assertEqual(len(records), 1)
+        self.assertEqual((records[0]["id"], records[0]["type"]), (7, "error"))
+
+    def test_large_reply_is_chunked(self):
+        request = {"id": 2, "algorithm": "FCFS",
+                   "processes": [{"pid": pid, "arrival": pid, "burst": 1} for pid in range(1, 3001)]}
+        chunks = list(OS.service_reply(request))
+        self.assertGreater(len(chunks), 1)
+        # An idle segment before t=1, one segment and one process line per process, metrics and done
+        self.assertEqual(sum(chunk.count(b"\n") for chunk in chunks), 1 + 3000 + 3000 + 2)
+
+
+class ServeTests(unittest.TestCase):
+    """End-to-end: a server subprocess on a Unix socket, read by plain socket clients until EOF."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.socket_path = os.path.join(directory.name, "scheduler.sock")
+        # Output goes to a file: a pipe would stay open for as long as any worker process lives
+        self.output = tempfile.TemporaryFile()
+        self.addCleanup(self.output.close)
+        self.server = subprocess.Popen([sys.executable, OS.__file__, "--serve", self.socket_path, "--workers", "2"],
+                                       stdout=self.output, stderr=subprocess.STDOUT)
+        self.addCleanup(self.stop_server)
+        # The socket file appears just before the server listens on it, so wait for a connection to succeed
+        deadline = time.monotonic() + 20
+        while True:
+            try:
+                self.connect().close()
+                break
+            except OSError:
+                if self.server.poll() is not None or time.monotonic() > deadline:
+                    self.fail("Server did not start: " + self.read_output())
+                time.sleep(0.05)
+
+    def stop_server(self):
+        if self.server.poll() is None:
+            self.server.send_signal(signal.SIGINT)
+            try:
+                self.server.wait(timeout=20)
+            except subprocess.TimeoutExpired:
+                self.server.kill()
+                self.server.wait()
+
+    def read_output(self):
+        self.output.seek(0)
+        return self.output.read().decode()
+
+    def connect(self):
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.settimeout(10)
+        client.connect(self.socket_path)
+        return client
+
+    def exchange(self, payload):
+        """Sends the payload, closes the sending side and reads until the server closes the connection."""
+        with self.connect() as client:
+            client.sendall(payload)
+            client.shutdown(socket.SHUT_WR)
+            received = []
+            while True:
+                data = client.recv(65536) # Times out (and fails the test) if EOF never comes
+                if not data:
+                    return decode(b"".join(received))
+                received.append(data)
+
+    def test_first_client_sees_eof(self):
+        records = self.exchange((json.dumps(example_request()) + "\n").encode())
+        self.assertEqual(records[-1], {"id": 1, "type": "done"})
+        self.assertEqual(records[-2]["avg_wait"], 4.75)
+
+    def test_error_reply_then_eof(self):
+        request = {"id": 3, "algorithm": "Priority Preemptive", "processes": [{"pid": 1, "arrival": 0, "burst": 2}]}
+        records = self.exchange((json.dumps(request) + "\n").encode())
+        self.assertEqual(len(records), 1)
+        self.assertEqual((records[0]["id"], records[0]["type"]), (3, "error"))
+
+    def test_bad_json(self):
+        records = self.exchange(b"not json\n[1, 2]\n")
+        self.assertEqual([(r["id"], r["type"]) for r in records], [(None, "error"), (None, "error")])
+
+    def test_requests_on_one_connection_are_answered_in_order(self):
+        payload = "".join(json.dumps(example_request(request_id, algorithm)) + "\n"
+                          for request_id, algorithm in enumerate(OS.SCHEDULER_TYPES))
+        records = self.exchange(payload.encode())
+        self.assertEqual([r["id"] for r in records if r["type"] == "done"], list(range(len(OS.SCHEDULER_TYPES))))
+        for request_id, algorithm in enumerate(OS.SCHEDULER_TYPES):
+            expected = [block[:3] for block in OS.simulate(example_request()["processes"], algorithm, 2).gantt_data]
+            segments = [(r["pid"], r["start"], r["duration"]) for r in records
+                        if r["id"] == request_id and r["type"] == "segment"]
+            self.assertEqual(segments, expected)
+
+    def test_stalled_clients_do_not_block_others(self):
+        big = {"id": 1, "algorithm": "FCFS",
+               "processes": [{"pid": pid, "arrival": pid, "burst": 1} for pid in range(1, 30001)]}
+        stalled = [self.connect() for _ in range(2)]
+        for client in stalled:
+            self.addCleanup(client.close)
+            client.sendall((json.dumps(big) + "\n").encode()) # Several MB of reply that is never read
+        time.sleep(1)
+        records = self.exchange((json.dumps(example_request(2)) + "\n").encode())
+        self.assertEqual(records[-1], {"id": 2, "type": "done"})
+
+    def test_shutdown_with_open_connections(self):
+        idle = self.connect()
+        self.addCleanup(idle.close)
+        busy = self.connect()
+        self.addCleanup(busy.close)
+        busy.sendall((json.dumps(example_request()) + "\n").encode())
+        busy.recv(65536)
+        self.server.send_signal(signal.SIGINT)
+        self.assertEqual(self.server.wait(timeout=10), 0)
+        self.assertNotIn("Traceback", self.read_output())
+        self.assertEqual(idle.recv(65536), b"") # Connections are closed, not left hanging
+        self.assertFalse(os.path.exists(self.socket_path))
+
+
+class DrainTimeoutTests(unittest.TestCase):
+    """A client that stops reading is disconnected after drain_timeout seconds."""
+
+    def test_stalled_client_is_dropped(self):
+        asyncio.run(self.check_stalled_client_is_dropped())
+
+    async def check_stalled_client_is_dropped(self):
+        with tempfile.TemporaryDirectory() as directory:
+            socket_path = os.path.join(directory, "scheduler.sock")
+            server = asyncio.create_task(OS.serve(socket_path, workers=1, drain_timeout=1))
+            while not os.path.exists(socket_path):
+                await asyncio.sleep(0.05)
+            big = {"id": 1, "algorithm": "FCFS",
+                   "processes": [{"pid": pid, "arrival": pid, "burst": 1} for pid in range(1, 30001)]}
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            writer.write((json.dumps(big) + "\n").encode())
+            await asyncio.sleep(4) # Read nothing for longer than the timeout
+            received = 0
+            try:
+                while True:
+                    data = await asyncio.wait_for(reader.read(1 << 20), 10)
+                    if not data:
+                        break
+                    received += len(data)
+            except ConnectionResetError:
+                pass
+            writer.close()
+            full = len(b"".join(OS.service_reply(big)))
+            self.assertLess(received, full)
+            server.cancel()
+            await asyncio.gather(server, return_exceptions=True)
+
+
+if __name__ == "__main__":
+    unittest.main()